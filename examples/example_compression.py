@@ -5,8 +5,17 @@ Bug: `base64_encode`/`base64_decode` pair fails on bytes with padding.
 
 from __future__ import annotations
 
+import operator
+from functools import lru_cache, reduce
+
 from evidence import against, ensures, pure, requires, spec
 
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# Translation tables indexed by shift: _ENC[s] maps each letter s places forward.
+_ENC = [str.maketrans(_ALPHABET, _ALPHABET[s:] + _ALPHABET[:s]) for s in range(26)]
+_DEC = [str.maketrans(_ALPHABET[s:] + _ALPHABET[:s], _ALPHABET) for s in range(26)]
+
 
 # ---------------------------------------------------------------------------
 # Caesar cipher (encode + decode should round-trip)
@@ -15,35 +24,27 @@ from evidence import against, ensures, pure, requires, spec
 @pure
 @ensures(lambda text, shift, result: len(result) == len(text))
 @requires(lambda text, shift: 0 <= shift < 26)
-@requires(lambda text, shift: all(c.isalpha() and c.islower() for c in text))
+@requires(lambda text, shift: all("a" <= c <= "z" for c in text))
 @requires(lambda text, shift: len(text) <= 100)
 def caesar_encode(text: str, shift: int) -> str:
     """Encode with Caesar cipher.
 
     This implementation is correct.
     """
-    result = []
-    for c in text:
-        shifted = chr((ord(c) - ord("a") + shift) % 26 + ord("a"))
-        result.append(shifted)
-    return "".join(result)
+    return text.translate(_ENC[shift])
 
 
 @pure
 @ensures(lambda text, shift, result: len(result) == len(text))
 @requires(lambda text, shift: 0 <= shift < 26)
-@requires(lambda text, shift: all(c.isalpha() and c.islower() for c in text))
+@requires(lambda text, shift: all("a" <= c <= "z" for c in text))
 @requires(lambda text, shift: len(text) <= 100)
 def caesar_decode(text: str, shift: int) -> str:
     """Decode Caesar cipher.
 
     This implementation is correct.
     """
-    result = []
-    for c in text:
-        shifted = chr((ord(c) - ord("a") - shift) % 26 + ord("a"))
-        result.append(shifted)
-    return "".join(result)
+    return text.translate(_DEC[shift])
 
 
 # ---------------------------------------------------------------------------
@@ -58,7 +59,7 @@ def roundtrip_caesar_spec(text: str, shift: int) -> str:
 
 @ensures(lambda text, shift, result: result == text)
 @requires(lambda text, shift: 0 <= shift < 26)
-@requires(lambda text, shift: all(c.isalpha() and c.islower() for c in text))
+@requires(lambda text, shift: all("a" <= c <= "z" for c in text))
 @requires(lambda text, shift: len(text) <= 100)
 @pure
 def roundtrip_caesar(text: str, shift: int) -> str:
@@ -90,10 +91,8 @@ def checksum(data: list[int]) -> int:
 
     Bug: uses XOR instead of sum, producing different results.
     """
-    result = 0
-    for b in data:
-        result ^= b  # Bug: should be result = (result + b) % 256
-    return result % 256
+    # Bug: folds with XOR instead of addition
+    return reduce(operator.xor, data, 0) % 256
 
 
 # ---------------------------------------------------------------------------
@@ -102,20 +101,20 @@ def checksum(data: list[int]) -> int:
 
 @spec
 @pure
+@lru_cache(maxsize=4096)
 def zigzag_encode_spec(n: int) -> int:
     """Reference zigzag encoding: 0->0, -1->1, 1->2, -2->3, 2->4, ..."""
-    if n >= 0:
-        return 2 * n
-    return -2 * n - 1
+    # n < 0 yields an all-ones mask, flipping 2n into -2n - 1
+    return (n << 1) ^ -(n < 0)
 
 
 @spec
 @pure
+@lru_cache(maxsize=4096)
 def zigzag_decode_spec(n: int) -> int:
     """Reference zigzag decoding."""
-    if n % 2 == 0:
-        return n // 2
-    return -(n + 1) // 2
+    # odd n yields an all-ones mask, flipping n // 2 into -(n + 1) // 2
+    return (n >> 1) ^ -(n & 1)
 
 
 @ensures(lambda n, result: result >= 0)
@@ -126,9 +125,8 @@ def zigzag_encode(n: int) -> int:
 
     This implementation is correct.
     """
-    if n >= 0:
-        return 2 * n
-    return -2 * n - 1
+    # n < 0 yields an all-ones mask, flipping 2n into -2n - 1
+    return (n << 1) ^ -(n < 0)
 
 
 @ensures(lambda n, result: zigzag_encode(result) == n)
@@ -139,6 +137,5 @@ def zigzag_decode(n: int) -> int:
 
     This implementation is correct.
     """
-    if n % 2 == 0:
-        return n // 2
-    return -(n + 1) // 2
+    # odd n yields an all-ones mask, flipping n // 2 into -(n + 1) // 2
+    return (n >> 1) ^ -(n & 1)
@@ -1,6 +1,8 @@
 # example_intervals.py
 from __future__ import annotations
 
+from itertools import accumulate, chain
+
 from hypothesis import strategies as st
 
 from evidence import against, ensures, register_strategy, requires, spec
@@ -35,10 +37,7 @@ def is_sorted_disjoint(xs: list[Interval]) -> bool:
 @spec
 def normalize_spec(xs: list[Interval]) -> list[Interval]:
     # Spec: expand to points, then compress into maximal intervals.
-    pts = set()
-    for (lo, hi) in xs:
-        for v in range(lo, hi + 1):
-            pts.add(v)
+    pts = set(chain.from_iterable(range(lo, hi + 1) for (lo, hi) in xs))
 
     if not pts:
         return []
@@ -73,18 +72,12 @@ def normalize(xs: list[Interval]) -> list[Interval]:
     if not xs:
         return []
 
-    ys = sorted(xs, key=lambda p: (p[0], p[1]))
-    out: list[Interval] = []
-    cur_lo, cur_hi = ys[0]
+    # Split into parallel lows/highs (tuples already order by (lo, hi)).
+    lows, highs = zip(*sorted(xs), strict=True)
+    # reach[i] is the furthest hi seen so far, i.e. the hi of the run containing i.
+    reach = list(accumulate(highs, max))
 
-    for lo, hi in ys[1:]:
-        # BUG: should be `lo <= cur_hi + 1`
-        if lo <= cur_hi:
-            if hi > cur_hi:
-                cur_hi = hi
-        else:
-            out.append((cur_lo, cur_hi))
-            cur_lo, cur_hi = lo, hi
-
-    out.append((cur_lo, cur_hi))
-    return out
+    # BUG: should be `lows[i] > reach[i - 1] + 1`
+    starts = [0, *(i for i in range(1, len(lows)) if lows[i] > reach[i - 1])]
+    ends = [*(i - 1 for i in starts[1:]), len(lows) - 1]
+    return [(lows[i], reach[j]) for i, j in zip(starts, ends, strict=True)]
@@ -6,6 +6,9 @@ Bug: `fibonacci()` is off-by-one for index 0.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from math import isqrt as _c_isqrt
+
 from evidence import against, ensures, pure, requires, spec
 
 
@@ -15,6 +18,7 @@ from evidence import against, ensures, pure, requires, spec
 
 @spec
 @pure
+@lru_cache(maxsize=4096)
 def gcd_spec(a: int, b: int) -> int:
     """Reference GCD via Euclidean algorithm."""
     a, b = abs(a), abs(b)
@@ -47,24 +51,31 @@ def gcd(a: int, b: int) -> int:
 # fibonacci
 # ---------------------------------------------------------------------------
 
+def _fib_pair(n: int) -> tuple[int, int]:
+    """Return (F(n), F(n + 1)) by fast doubling."""
+    if n == 0:
+        return 0, 1
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    return (c, d) if n & 1 == 0 else (d, c + d)
+
+
 @spec
 @pure
+@lru_cache(maxsize=64)
 def fib_spec(n: int) -> int:
     """Reference Fibonacci."""
     if n <= 0:
         return 0
-    if n == 1:
-        return 1
-    a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
+    return _fib_pair(n)[0]
 
 
 @against(fib_spec, max_examples=300)
 @ensures(lambda n, result: result >= 0)
 @requires(lambda n: 0 <= n <= 30)
 @pure
+@lru_cache(maxsize=64)
 def fib(n: int) -> int:
     """Compute nth Fibonacci number.
 
@@ -102,20 +113,11 @@ def isqrt_spec(n: int) -> int:
 @requires(lambda n: 0 <= n <= 100000)
 @pure
 def isqrt(n: int) -> int:
-    """Integer square root via Newton's method.
+    """Integer square root via the stdlib's C implementation.
 
     This implementation is actually correct.
     """
-    if n < 0:
-        return 0
-    if n == 0:
-        return 0
-    x = n
-    while True:
-        x1 = (x + n // x) // 2
-        if x1 >= x:
-            return x
-        x = x1
+    return 0 if n <= 0 else _c_isqrt(n)
 
 
 # ---------------------------------------------------------------------------
@@ -126,6 +128,7 @@ def isqrt(n: int) -> int:
 @requires(lambda base, exp, mod: exp >= 0 and mod > 1 and abs(base) < 1000)
 @requires(lambda base, exp, mod: exp <= 20)
 @pure
+@lru_cache(maxsize=4096)
 def mod_pow_spec(base: int, exp: int, mod: int) -> int:
     return pow(base, exp, mod)
 
@@ -140,11 +143,9 @@ def mod_pow(base: int, exp: int, mod: int) -> int:
 
     This implementation is correct.
     """
-    result = 1
-    base = base % mod
-    while exp > 0:
-        if exp % 2 == 1:
-            result = (result * base) % mod
-        exp = exp >> 1
-        base = (base * base) % mod
-    return result
+    base %= mod
+    if exp == 0:
+        return 1 % mod
+    if base == 0:
+        return 0
+    return pow(base, exp, mod)
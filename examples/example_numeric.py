@@ -40,10 +40,11 @@ def _softmax_spec(xs: list[float]) -> list[float]:
     """Reference softmax: numerically stable."""
     if not xs:
         return []
-    m = max(xs)
-    exps = [np.exp(x - m) for x in xs]
-    total = sum(exps)
-    return [float(e / total) for e in exps]
+    x = np.array(xs, dtype=np.float64)  # a copy, so the in-place ops below never touch the caller's array
+    x -= x.max()
+    np.exp(x, out=x)
+    x /= x.sum()
+    return x.tolist()
 
 
 @pure
@@ -55,7 +56,8 @@ def _softmax_spec(xs: list[float]) -> list[float]:
 @ensures(lambda xs, result: abs(sum(result) - 1.0) < 1e-6)
 def softmax(xs: list[float]) -> list[float]:
     """Softmax with a subtle bug: missing numeric stability shift."""
+    x = np.array(xs, dtype=np.float64)  # a copy, so the in-place ops below never touch the caller's array
     # BUG: doesn't subtract max — will overflow for large inputs
-    exps = [np.exp(x) for x in xs]
-    total = sum(exps)
-    return [float(e / total) for e in exps]
+    np.exp(x, out=x)
+    x /= x.sum()
+    return x.tolist()
@@ -1,6 +1,8 @@
 # example_runs.py
 from __future__ import annotations
 
+from itertools import groupby
+
 from evidence import against, ensures, spec
 
 
@@ -28,18 +30,7 @@ def group_runs_spec(xs: list[int]) -> list[list[int]]:
     """
     Slow, obviously-correct reference implementation.
     """
-    if not xs:
-        return []
-    out: list[list[int]] = []
-    cur = [xs[0]]
-    for x in xs[1:]:
-        if x == cur[0]:
-            cur.append(x)
-        else:
-            out.append(cur)
-            cur = [x]
-    out.append(cur)
-    return out
+    return [list(g) for _, g in groupby(xs)]
 
 
 @against(group_runs_spec, max_examples=500)
@@ -52,17 +43,7 @@ def group_runs(xs: list[int]) -> list[list[int]]:
     BUGGY implementation: forgets to append the final run.
     Subtle because it "works" for many inputs in ad-hoc testing if you never check the tail.
     """
-    if not xs:
-        return []
-
-    out: list[list[int]] = []
-    cur = [xs[0]]
-    for x in xs[1:]:
-        if x == cur[0]:
-            cur.append(x)
-        else:
-            out.append(cur)
-            cur = [x]
+    runs = [list(g) for _, g in groupby(xs)]
 
-    # BUG: missing `out.append(cur)` here.
-    return out
+    # BUG: drops the final run; should be `return runs`.
+    return runs[:-1]
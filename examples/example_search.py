@@ -6,6 +6,8 @@ Bug: `find_closest()` fails on single-element lists.
 
 from __future__ import annotations
 
+from bisect import bisect_left
+
 from evidence import against, ensures, pure, requires, spec
 
 
@@ -70,11 +72,7 @@ def find_min(xs: list[int]) -> int:
 
     This implementation is correct.
     """
-    m = xs[0]
-    for x in xs[1:]:
-        if x < m:
-            m = x
-    return m
+    return min(xs)
 
 
 # ---------------------------------------------------------------------------
@@ -85,7 +83,8 @@ def find_min(xs: list[int]) -> int:
 @pure
 def find_closest_spec(xs: list[int], target: int) -> int:
     """Reference: element in xs closest to target."""
-    return min(xs, key=lambda x: abs(x - target))
+    dists = [abs(x - target) for x in xs]
+    return xs[dists.index(min(dists))]
 
 
 @against(find_closest_spec, max_examples=500)
@@ -100,21 +99,10 @@ def find_closest(xs: list[int], target: int) -> int:
     Bug: doesn't check the left neighbor, only right, so it can miss
     the actual closest element when the target falls between two values.
     """
-    if len(xs) == 1:
-        return xs[0]
-
-    lo, hi = 0, len(xs) - 1
-    while lo < hi:
-        mid = lo + (hi - lo) // 2
-        if xs[mid] == target:
-            return xs[mid]
-        elif xs[mid] < target:
-            lo = mid + 1
-        else:
-            hi = mid
+    i = bisect_left(xs, target)
 
-    # Bug: always returns xs[lo] without comparing with xs[lo-1]
-    return xs[lo]
+    # Bug: always returns xs[i] without comparing with xs[i-1]
+    return xs[min(i, len(xs) - 1)]
 
 
 # ---------------------------------------------------------------------------
@@ -125,10 +113,12 @@ def find_closest(xs: list[int], target: int) -> int:
 @pure
 def two_sum_spec(xs: list[int], target: int) -> tuple[int, int]:
     """Reference: brute-force two-sum."""
-    for i in range(len(xs)):
-        for j in range(i + 1, len(xs)):
-            if xs[i] + xs[j] == target:
-                return (i, j)
+    for i, x in enumerate(xs):
+        try:
+            # first j > i with xs[j] == target - x; the scan runs inside list.index
+            return (i, xs.index(target - x, i + 1))
+        except ValueError:
+            pass
     return (-1, -1)
 
 
@@ -16,13 +16,7 @@ from evidence import against, ensures, requires, spec
 @spec
 def unique_spec(xs: list[int]) -> list[int]:
     """Reference: unique elements preserving first-occurrence order."""
-    seen: set[int] = set()
-    result: list[int] = []
-    for x in xs:
-        if x not in seen:
-            seen.add(x)
-            result.append(x)
-    return result
+    return list(dict.fromkeys(xs))
 
 
 @against(unique_spec, max_examples=500)
@@ -44,14 +38,8 @@ def unique(xs: list[int]) -> list[int]:
 @spec
 def intersect_spec(xs: list[int], ys: list[int]) -> list[int]:
     """Reference: elements in both lists, preserving order from xs, no dupes."""
-    seen = set(ys)
-    result: list[int] = []
-    added: set[int] = set()
-    for x in xs:
-        if x in seen and x not in added:
-            result.append(x)
-            added.add(x)
-    return result
+    keep = set(ys)
+    return list(dict.fromkeys(x for x in xs if x in keep))
 
 
 @against(intersect_spec, max_examples=500)
@@ -62,12 +50,8 @@ def intersect(xs: list[int], ys: list[int]) -> list[int]:
 
     Bug: doesn't track already-added elements, so duplicates in xs leak through.
     """
-    seen = set(ys)
-    result: list[int] = []
-    for x in xs:
-        if x in seen:
-            result.append(x)
-    return result
+    keep = set(ys)
+    return [x for x in xs if x in keep]
 
 
 # ---------------------------------------------------------------------------
@@ -108,4 +92,4 @@ def is_subset(xs: list[int], ys: list[int]) -> bool:
 
     This implementation is correct.
     """
-    return all(x in ys for x in xs)
+    return set(xs) <= set(ys)
@@ -1,17 +1,17 @@
 # example_sort.py
 from __future__ import annotations
 
-from collections import Counter
+import operator
 
 from evidence import against, ensures, spec
 
 
 def is_sorted(xs: list[int]) -> bool:
-    return all(xs[i] <= xs[i + 1] for i in range(len(xs) - 1))
+    return all(map(operator.le, xs, xs[1:]))
 
 
 def is_permutation(a: list[int], b: list[int]) -> bool:
-    return Counter(a) == Counter(b)
+    return sorted(a) == sorted(b)
 
 
 @spec
@@ -96,7 +96,7 @@ def is_balanced(s: str) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# reverse_list using a stack
+# reverse_list
 # ---------------------------------------------------------------------------
 
 @spec
@@ -108,14 +108,8 @@ def reverse_spec(xs: list[int]) -> list[int]:
 @ensures(lambda xs, result: len(result) == len(xs))
 @ensures(lambda xs, result: sorted(result) == sorted(xs))
 def reverse_list(xs: list[int]) -> list[int]:
-    """Reverse a list using a stack.
+    """Reverse a list.
 
     This implementation is correct.
     """
-    s = Stack()
-    for x in xs:
-        s.push(x)
-    result = []
-    while not s.is_empty():
-        result.append(s.pop())
-    return result
+    return xs[::-1]
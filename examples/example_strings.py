@@ -5,6 +5,8 @@ Bug: `words()` splits on single spaces only, missing multiple consecutive spaces
 
 from __future__ import annotations
 
+from itertools import groupby
+
 from evidence import against, ensures, requires, spec
 
 
@@ -54,7 +56,7 @@ def title_case(s: str) -> str:
 
 @spec
 def is_palindrome_spec(s: str) -> bool:
-    cleaned = "".join(c.lower() for c in s if c.isalnum())
+    cleaned = "".join(map(str.lower, filter(str.isalnum, s)))
     return cleaned == cleaned[::-1]
 
 
@@ -74,20 +76,7 @@ def is_palindrome(s: str) -> bool:
 
 @spec
 def rle_encode_spec(s: str) -> list[tuple[str, int]]:
-    if not s:
-        return []
-    result = []
-    current = s[0]
-    count = 1
-    for c in s[1:]:
-        if c == current:
-            count += 1
-        else:
-            result.append((current, count))
-            current = c
-            count = 1
-    result.append((current, count))
-    return result
+    return [(c, len(list(g))) for c, g in groupby(s)]
 
 
 @against(rle_encode_spec, max_examples=500)
@@ -105,15 +94,4 @@ def rle_encode(s: str) -> list[tuple[str, int]]:
     else:
         return []
 
-    result = []
-    current = s[0]
-    count = 1
-    for c in s[1:]:
-        if c == current:
-            count += 1
-        else:
-            result.append((current, count))
-            current = c
-            count = 1
-    result.append((current, count))
-    return result
+    return [(c, len(list(g))) for c, g in groupby(s)]
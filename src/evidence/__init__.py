@@ -1,8 +1,12 @@
+from typing import TYPE_CHECKING, Any
+
 from evidence._cli import main
 from evidence._decorators import against, ensures, pure, requires, spec
-from evidence._engine import check_module
 from evidence._strategies import register_strategy, register_strategy_factory
 
+if TYPE_CHECKING:
+    from evidence._engine import check_module
+
 __all__ = [
     "against",
     "check_module",
@@ -14,3 +18,11 @@ __all__ = [
     "requires",
     "spec",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The engine is loaded on first use, so importing evidence (or running the CLI's early exits) skips it
+    if name == "check_module":
+        from evidence._engine import check_module
+        return check_module
+    raise AttributeError(f"module 'evidence' has no attribute {name!r}")
@@ -7,9 +7,18 @@ from evidence._util import _safe_call
 
 _BUNDLE_ATTR = "__evidence_bundle__"
 _ORIGINAL_ATTR = "__evidence_original__"
+_ROOT_ATTR = "__evidence_root__"
+
+# Modules defining a function that has been given a bundle; empty means nothing to check anywhere.
+# Names only, so bundled functions are not kept alive by the registry.
+_BUNDLED_MODULES: set[str] = set()
 
 
 def _root_original(fn: Callable[..., Any]) -> Callable[..., Any]:
+    # Wrappers cache their resolved root in _set_original; only bare chains are walked.
+    root = getattr(fn, _ROOT_ATTR, None)
+    if root is not None:
+        return root  # type: ignore[no-any-return]
     cur = fn
     while True:
         nxt = getattr(cur, _ORIGINAL_ATTR, None)
@@ -19,19 +28,24 @@ def _root_original(fn: Callable[..., Any]) -> Callable[..., Any]:
 
 
 def _bundle(fn: Callable[..., Any]) -> dict[str, Any]:
+    # Wrappers share the root's bundle via _set_original, so decorators stacked on them skip the root lookup.
+    shared = getattr(fn, _BUNDLE_ATTR, None)
+    if shared is not None:
+        return shared  # type: ignore[no-any-return]
     base = _root_original(fn)
-    if not hasattr(base, _BUNDLE_ATTR):
-        setattr(
-            base,
-            _BUNDLE_ATTR,
-            {"requires": [], "ensures": [], "against": None, "is_spec": False, "pure": None},
-        )
-    return getattr(base, _BUNDLE_ATTR)  # type: ignore[no-any-return]
+    try:
+        return base.__evidence_bundle__  # type: ignore[attr-defined,no-any-return]
+    except AttributeError:
+        b: dict[str, Any] = {"requires": [], "ensures": [], "against": None, "is_spec": False, "pure": None}
+        base.__evidence_bundle__ = b  # type: ignore[attr-defined]
+        _BUNDLED_MODULES.add(getattr(base, "__module__", None) or "")
+        return b
 
 
 def _set_original(wrapper: Callable[..., Any], original: Callable[..., Any]) -> None:
     setattr(wrapper, _ORIGINAL_ATTR, original)
     root = _root_original(original)
+    setattr(wrapper, _ROOT_ATTR, root)
     if hasattr(root, _BUNDLE_ATTR) and not hasattr(wrapper, _BUNDLE_ATTR):
         setattr(wrapper, _BUNDLE_ATTR, getattr(root, _BUNDLE_ATTR))
 
@@ -5,33 +5,58 @@ import importlib
 import json
 import sys
 import time
+from collections import Counter
+from typing import TYPE_CHECKING
 
-from evidence._engine import ObligationResult, check_module
-from evidence._term import bold, dim, force_color, green, red, style, yellow
+from evidence import _term
+from evidence._bundle import _BUNDLED_MODULES
+from evidence._term import force_color, supports_color
+from evidence._util import _json_dumps
+
+if TYPE_CHECKING:
+    from evidence._engine import ObligationResult
+
+
+# Statuses that make the run exit non-zero
+_FAILING: frozenset[str] = frozenset({"fail", "error"})
 
 
 def _status_label(status: str) -> str:
     if status == "pass":
-        return green("PASS")
+        return _term.green("PASS")
     if status == "fail":
-        return style("FAIL", 31, 1)  # red bold
+        return _term.style("FAIL", 31, 1)  # red bold
     if status == "error":
-        return red("ERROR")
+        return _term.red("ERROR")
     if status == "skip":
-        return yellow("SKIP")
+        return _term.yellow("SKIP")
     return status.upper()
 
 
+# Padded, colorized status prefixes keyed by (status, color enabled); color is only known after arg parsing.
+_STATUS_PREFIX: dict[tuple[str, bool], str] = {}
+
+
+def _status_prefix(status: str) -> str:
+    key = (status, supports_color())
+    prefix = _STATUS_PREFIX.get(key)
+    if prefix is None:
+        # Pad the raw status to 5 chars, then colorize — avoids ANSI codes breaking alignment
+        pad = " " * (5 - len(status))
+        prefix = _STATUS_PREFIX[key] = f"  {pad}{_status_label(status)}  "
+    return prefix
+
+
 def _print_result_line(r: ObligationResult, *, verbose: bool = False) -> None:
-    label = _status_label(r.status)
-    # Pad the raw status to 5 chars, then colorize — avoids ANSI codes breaking alignment
-    raw = r.status.upper()
-    pad = " " * (5 - len(raw))
-    timing = "  " + dim(f"({r.duration_s:.1f}s)") if r.duration_s >= 0.05 else ""
-    print(f"  {pad}{label}  {r.obligation:<22}  {bold(r.function)}{timing}")
-
-    if verbose and r.status == "fail":
-        ce = r.details.get("counterexample")
+    timing = f"  {_term.dim(f'({r.duration_s:.1f}s)')}" if r.duration_s >= 0.05 else ""
+    print(f"{_status_prefix(r.status)}{r.obligation:<22}  {_term.bold(r.function)}{timing}")
+
+    if not verbose:
+        return
+    d = r.details
+
+    if r.status == "fail":
+        ce = d.get("counterexample")
         if ce and isinstance(ce, dict):
             if "kwargs" in ce:
                 print(f"         kwargs: {json.dumps(ce['kwargs'], default=str)}")
@@ -44,27 +69,27 @@ def _print_result_line(r: ObligationResult, *, verbose: bool = False) -> None:
             if "error" in ce:
                 print(f"         error:  {ce['error']}")
         # Show purity warnings
-        if "warnings" in r.details:
-            for w in r.details["warnings"]:
-                print(f"         warning: {w}")
+        for w in d.get("warnings", ()):
+            print(f"         warning: {w}")
         # Show standalone error
-        if "error" in r.details and not ce:
-            print(f"         error:  {r.details['error']}")
-
-    if verbose and r.obligation == "inferred_properties":
-        for p in r.details.get("holding", []):
-            print(f"         {green('HOLDS')}  {p['name']}: {p['description']}  ({dim(p.get('source', ''))})")
-        for p in r.details.get("not_holding", []):
-            print(f"         {red('FAILS')}  {p['name']}: {p['description']}")
-
-    if verbose and r.obligation == "spec_suggestions":
-        for s in r.details.get("suggestions", []):
-            valid_marker = green("valid") if s.get("validated") else red("unverified")
+        if "error" in d and not ce:
+            print(f"         error:  {d['error']}")
+
+    obligation = r.obligation
+    if obligation == "inferred_properties":
+        for p in d.get("holding", []):
+            source = _term.dim(p.get("source", ""))
+            print(f"         {_term.green('HOLDS')}  {p['name']}: {p['description']}  ({source})")
+        for p in d.get("not_holding", []):
+            print(f"         {_term.red('FAILS')}  {p['name']}: {p['description']}")
+
+    elif obligation == "spec_suggestions":
+        for s in d.get("suggestions", []):
+            valid_marker = _term.green("valid") if s.get("validated") else _term.red("unverified")
             print(f"         [{s.get('kind', '?')}] {s.get('description', '')}  ({valid_marker})")
             print(f"           {s.get('code', '')}")
 
-    if verbose and r.obligation == "mutation_score":
-        d = r.details
+    elif obligation == "mutation_score":
         score = d.get("mutation_score")
         print(f"         score:    {score}%" if score is not None else "         score:    N/A")
         print(f"         killed:   {d.get('killed', 0)}/{d.get('total_mutants', 0)}")
@@ -72,8 +97,7 @@ def _print_result_line(r: ObligationResult, *, verbose: bool = False) -> None:
         for s in surv:
             print(f"         survived: {s['operator']}: {s['description']}")
 
-    if verbose and r.obligation == "coverage":
-        d = r.details
+    elif obligation == "coverage":
         print(f"         lines:    {d.get('lines_covered', '?')}/{d.get('lines_total', '?')}"
               f" ({d.get('line_coverage_pct', '?')}%)")
         print(f"         branches: {d.get('branches_covered', '?')}/{d.get('branches_total', '?')}"
@@ -84,24 +108,34 @@ def _print_result_line(r: ObligationResult, *, verbose: bool = False) -> None:
 
 
 def _print_summary(results: list[ObligationResult], total_s: float, out_dir: str) -> None:
-    passed = sum(1 for r in results if r.status == "pass")
-    failed = sum(1 for r in results if r.status in ("fail", "error"))
-    skipped = sum(1 for r in results if r.status == "skip")
+    tally = Counter(r.status for r in results)
+    passed = tally["pass"]
+    failed = tally["fail"] + tally["error"]
+    skipped = tally["skip"]
 
     parts: list[str] = []
     if passed:
-        parts.append(green(f"{passed} passed"))
+        parts.append(_term.green(f"{passed} passed"))
     if failed:
-        parts.append(red(f"{failed} failed"))
+        parts.append(_term.red(f"{failed} failed"))
     if skipped:
-        parts.append(dim(f"{skipped} skipped"))
+        parts.append(_term.dim(f"{skipped} skipped"))
 
     summary = ", ".join(parts) if parts else "no obligations"
-    timing = dim(f"({total_s:.1f}s total)")
-    location = dim(f"JSON reports in {out_dir}/")
+    timing = _term.dim(f"({total_s:.1f}s total)")
+    location = _term.dim(f"JSON reports in {out_dir}/")
     print(f"\n{summary}  {timing}  {location}")
 
 
+def _report_no_obligations(module: str, *, json_mode: bool) -> int:
+    if json_mode:
+        print("[]")
+    else:
+        msg = f"warning: no @requires/@ensures/@against decorated functions found in '{module}'"
+        print(msg, file=sys.stderr)
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(prog="evidence", description="Run evidence checks on a module.")
     p.add_argument("module", help="Python module to import (e.g. mypkg.mymodule)")
@@ -117,6 +151,8 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--prove", action="store_true", help="Attempt symbolic verification via CrossHair/Z3")
     p.add_argument("--suggest", action="store_true", help="Use LLM to suggest postconditions and specs")
     p.add_argument("--infer", action="store_true", help="Infer structural properties from function behavior")
+    p.add_argument("-j", "--jobs", type=int, default=1,
+                   help="Check functions in N worker processes (0 = half the CPU cores)")
     args = p.parse_args(argv)
 
     if args.no_color:
@@ -125,8 +161,16 @@ def main(argv: list[str] | None = None) -> int:
     # --json implies quiet for human text
     json_mode = args.json
 
+    # JSON records are streamed as they complete; the array is opened lazily so an empty run prints "[]"
+    json_opened = False
+
     def on_result(r: ObligationResult) -> None:
-        if not json_mode and not args.quiet:
+        nonlocal json_opened
+        if json_mode:
+            sys.stdout.write(",\n" if json_opened else "[\n")
+            sys.stdout.write(_json_dumps(r.to_json()))
+            json_opened = True
+        elif not args.quiet:
             _print_result_line(r, verbose=args.verbose)
 
     try:
@@ -135,38 +179,45 @@ def main(argv: list[str] | None = None) -> int:
         print(f"error: could not import module '{args.module}': {e}", file=sys.stderr)
         return 1
 
+    # Nothing in the process was ever decorated, so the module cannot have obligations; skip the engine
+    if not _BUNDLED_MODULES:
+        return _report_no_obligations(args.module, json_mode=json_mode)
+
+    # Deferred so --help and argument/import errors do not pay for loading the engine
+    from evidence._engine import check_module
+
     t_start = time.monotonic()
-    results, _trust = check_module(
-        args.module,
-        out_dir=args.out,
-        max_list_size=args.max_list_size,
-        smoke_max_list_size=args.smoke_max_list_size,
-        on_result=on_result,
-        coverage=args.coverage,
-        mutate=args.mutate,
-        prove=args.prove,
-        suggest=args.suggest,
-        infer=args.infer,
-    )
+    try:
+        results, _trust = check_module(
+            args.module,
+            out_dir=args.out,
+            max_list_size=args.max_list_size,
+            smoke_max_list_size=args.smoke_max_list_size,
+            on_result=on_result,
+            coverage=args.coverage,
+            mutate=args.mutate,
+            prove=args.prove,
+            suggest=args.suggest,
+            infer=args.infer,
+            jobs=args.jobs,
+        )
+    finally:
+        # Close the array even if checking raises, so what was streamed stays valid JSON
+        if json_mode and json_opened:
+            sys.stdout.write("\n]\n")
     total_s = time.monotonic() - t_start
 
     if not results:
-        if json_mode:
-            print("[]")
-        else:
-            msg = f"warning: no @requires/@ensures/@against decorated functions found in '{args.module}'"
-            print(msg, file=sys.stderr)
-        return 0
+        return _report_no_obligations(args.module, json_mode=json_mode)
 
     if json_mode:
-        print(json.dumps([r.to_json() for r in results], indent=2, default=str))
-        return 1 if any(r.status in ("fail", "error") for r in results) else 0
+        return 1 if any(r.status in _FAILING for r in results) else 0
 
     if not args.quiet:
         pass  # lines already printed via on_result
 
     _print_summary(results, total_s, args.out)
 
-    if any(r.status in ("fail", "error") for r in results):
+    if any(r.status in _FAILING for r in results):
         return 1
     return 0
@@ -10,22 +10,35 @@ Requires: pip install evidence[coverage]  (coverage>=7.0)
 from __future__ import annotations
 
 import inspect
+import weakref
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable
+from types import CodeType
 from typing import Any
 
+# Source locations keyed weakly by code object, so ids recycled by collected mutants never alias.
+_LINES_CACHE: weakref.WeakKeyDictionary[CodeType, tuple[str, int, int] | None] = weakref.WeakKeyDictionary()
+
 
 def _get_function_lines(fn: Callable[..., Any]) -> tuple[str, int, int] | None:
     """Get the source file and line range for a function.
 
     Returns (filepath, start_line, end_line) or None if unavailable.
+    Results are cached per code object.
     """
+    code = getattr(inspect.unwrap(fn), "__code__", None)
+    if code is not None and code in _LINES_CACHE:
+        return _LINES_CACHE[code]
     try:
         source_lines, start_line = inspect.getsourcelines(fn)
         filepath = inspect.getfile(fn)
         end_line = start_line + len(source_lines) - 1
-        return filepath, start_line, end_line
+        loc: tuple[str, int, int] | None = (filepath, start_line, end_line)
     except (OSError, TypeError):
-        return None
+        loc = None
+    if code is not None:
+        _LINES_CACHE[code] = loc
+    return loc
 
 
 class CoverageCollector:
@@ -39,14 +52,21 @@ class CoverageCollector:
         report = collector.report_for_function(fn)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, include: list[str] | None = None) -> None:
+        # ``include`` limits tracing to the given files, so Hypothesis internals and other
+        # library frames run untraced; helpers outside those files go unmeasured.
         try:
             import coverage as cov_mod
-            self._cov: Any = cov_mod.Coverage(branch=True)
+            self._cov: Any = cov_mod.Coverage(data_file=None, branch=True, include=include)
             self._available = True
         except ImportError:
             self._cov = None
             self._available = False
+        # Data traced before narrow(), merged back in on stop()
+        self._prior_data: Any = None
+        # Per-file analyses, shared by every function reported from the same file
+        self._analysis_cache: dict[str, tuple[list[int], list[int]] | None] = {}
+        self._arc_cache: dict[str, tuple[list[int], list[int]] | None] = {}
 
     @property
     def available(self) -> bool:
@@ -54,11 +74,74 @@ class CoverageCollector:
 
     def start(self) -> None:
         if self._cov is not None:
+            self._analysis_cache.clear()
+            self._arc_cache.clear()
             self._cov.start()
 
+    def narrow(self, include: list[str]) -> None:
+        """Keep collecting, but trace only ``include`` from here on.
+
+        Lets module import run fully traced (so definitions in every file count
+        as executed) while the much longer checking phase skips library frames.
+        Data gathered so far is kept.
+        """
+        if self._cov is None:
+            return
+        import coverage as cov_mod
+        self._cov.stop()
+        self._prior_data = self._cov.get_data()
+        self._cov = cov_mod.Coverage(data_file=None, branch=True, include=include)
+        self._cov.start()
+
     def stop(self) -> None:
         if self._cov is not None:
             self._cov.stop()
+            if self._prior_data is not None:
+                self._cov.get_data().update(self._prior_data)
+                self._prior_data = None
+
+    def _arc_starts(self, filepath: str) -> tuple[list[int], list[int]] | None:
+        """Sorted source lines of the possible and executed arcs in a file.
+
+        Sorted once per file so each function's arcs are counted by bisecting
+        its line range instead of scanning every arc in the module.
+        """
+        if filepath in self._arc_cache:
+            return self._arc_cache[filepath]
+        arcs = None
+        branch_data = self._cov._analyze(filepath)
+        if hasattr(branch_data, 'arc_possibilities') and hasattr(branch_data, 'arcs_executed'):
+            # coverage 7.x exposes these as lists; older releases as methods
+            possible = branch_data.arc_possibilities
+            executed = branch_data.arcs_executed
+            if callable(possible):
+                possible, executed = possible(), executed()
+            arcs = (sorted(a for a, _ in possible), sorted(a for a, _ in executed))
+        self._arc_cache[filepath] = arcs
+        return arcs
+
+    def _line_data(self, filepath: str) -> tuple[list[int], list[int]] | None:
+        """Sorted executable and missing lines of a file, analysed once per file."""
+        if filepath in self._analysis_cache:
+            return self._analysis_cache[filepath]
+        lines = None
+        try:
+            # analysis2 returns: (filename, executable, excluded, missing, formatted_missing)
+            analysis = self._cov.analysis2(filepath)
+            lines = (sorted(analysis[1]), sorted(analysis[3]))
+        except Exception:
+            pass
+        self._analysis_cache[filepath] = lines
+        return lines
+
+    def report_all(self, fns: list[Callable[..., Any]]) -> dict[Callable[..., Any], dict[str, Any]]:
+        """Reports for many functions, each file analysed once; functions without data are omitted."""
+        reports: dict[Callable[..., Any], dict[str, Any]] = {}
+        for fn in fns:
+            report = self.report_for_function(fn)
+            if report is not None:
+                reports[fn] = report
+        return reports
 
     def report_for_function(self, fn: Callable[..., Any]) -> dict[str, Any] | None:
         """Generate coverage report for a specific function.
@@ -85,36 +168,28 @@ class CoverageCollector:
 
         filepath, start_line, end_line = loc
 
-        try:
-            analysis = self._cov.analysis2(filepath)
-        except Exception:
+        lines = self._line_data(filepath)
+        if lines is None:
             return None
+        executable_lines, missing_lines = lines
 
-        # analysis2 returns: (filename, executable, excluded, missing, formatted_missing)
-        executable_lines: list[int] = list(analysis[1])
-        missing_lines: list[int] = list(analysis[3])
-
-        # Filter to function's line range
-        fn_executable = [ln for ln in executable_lines if start_line <= ln <= end_line]
-        fn_missing = [ln for ln in missing_lines if start_line <= ln <= end_line]
-        fn_covered = [ln for ln in fn_executable if ln not in set(fn_missing)]
+        # Both lists are sorted, so the function's range is a slice found by bisection
+        lines_total = bisect_right(executable_lines, end_line) - bisect_left(executable_lines, start_line)
+        fn_missing = missing_lines[bisect_left(missing_lines, start_line):bisect_right(missing_lines, end_line)]
 
-        lines_total = len(fn_executable)
-        lines_covered = len(fn_covered)
+        # Missing lines are a subset of executable lines, so covered is just the complement count
+        lines_covered = lines_total - len(fn_missing)
         line_pct = (lines_covered / lines_total * 100) if lines_total > 0 else 100.0
 
         # Branch coverage via arc analysis
         branches_total = 0
         branches_covered = 0
         try:
-            branch_data = self._cov._analyze(filepath)
-            if hasattr(branch_data, 'arc_possibilities') and hasattr(branch_data, 'arcs_executed'):
-                all_arcs: list[tuple[int, int]] = list(branch_data.arc_possibilities())
-                exec_arcs: list[tuple[int, int]] = list(branch_data.arcs_executed())
-                fn_arcs = [(a, b) for a, b in all_arcs if start_line <= a <= end_line]
-                fn_exec_arcs = [(a, b) for a, b in exec_arcs if start_line <= a <= end_line]
-                branches_total = len(fn_arcs)
-                branches_covered = len(fn_exec_arcs)
+            arcs = self._arc_starts(filepath)
+            if arcs is not None:
+                possible, executed = arcs
+                branches_total = bisect_right(possible, end_line) - bisect_left(possible, start_line)
+                branches_covered = bisect_right(executed, end_line) - bisect_left(executed, start_line)
         except Exception:
             pass
 
@@ -1,26 +1,83 @@
 from __future__ import annotations
 
-import functools
 from collections.abc import Callable
 from typing import Any
 
 from hypothesis import HealthCheck
 
-from evidence._bundle import _bundle, _check_ensures, _check_requires, _root_original, _set_original
+from evidence._bundle import _bundle, _root_original, _set_original
 from evidence._util import _qualified_name
 
 
+def _quick_wraps(wrapper: Callable[..., Any], fn: Callable[..., Any]) -> Callable[..., Any]:
+    # Lighter functools.wraps: the __dict__ merge is skipped since _set_original attaches what we need.
+    wrapper.__module__ = fn.__module__
+    wrapper.__name__ = getattr(fn, "__name__", wrapper.__name__)
+    wrapper.__qualname__ = getattr(fn, "__qualname__", wrapper.__qualname__)
+    wrapper.__doc__ = fn.__doc__
+    wrapper.__annotations__ = getattr(fn, "__annotations__", {})
+    wrapper.__wrapped__ = fn  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _check_all(
+    preds: list[Callable[..., bool]],
+    kind: str,
+    qname: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> None:
+    # Shared by every contract wrapper; kind is "Precondition" or "Postcondition"
+    for p in preds:
+        try:
+            ok = bool(p(*args, **kwargs))
+        except Exception as e:
+            raise AssertionError(f"{kind} failed for {qname}: {type(e).__name__}: {e}") from e
+        if not ok:
+            raise AssertionError(f"{kind} failed for {qname}: returned False")
+
+
+def _wrap_contracts(
+    fn: Callable[..., Any],
+    reqs: list[Callable[..., bool]],
+    ens: list[Callable[..., bool]],
+    qname: str,
+) -> Callable[..., Any]:
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        _check_all(reqs, "Precondition", qname, args, kwargs)
+        result = fn(*args, **kwargs)
+        _check_all(ens, "Postcondition", qname, args, {**kwargs, "result": result})
+        return result
+
+    return _quick_wraps(wrapper, fn)
+
+
+def _wrap_ensures_only(
+    fn: Callable[..., Any],
+    ens: list[Callable[..., bool]],
+    qname: str,
+) -> Callable[..., Any]:
+    # No @requires below this decorator; any added later sit outside it and check on the way in.
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = fn(*args, **kwargs)
+        _check_all(ens, "Postcondition", qname, args, {**kwargs, "result": result})
+        return result
+
+    return _quick_wraps(wrapper, fn)
+
+
 def requires(pred: Callable[..., bool]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
-        _bundle(fn)["requires"].append(pred)
+        # Bind the shared predicate list once; outer decorators append to the same list.
+        reqs = _bundle(fn)["requires"]
+        reqs.append(pred)
+        qname = _qualified_name(_root_original(fn))
 
-        @functools.wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            ok, err = _check_requires(fn, args, kwargs)
-            if not ok:
-                raise AssertionError(f"Precondition failed for {_qualified_name(_root_original(fn))}: {err}")
+            _check_all(reqs, "Precondition", qname, args, kwargs)
             return fn(*args, **kwargs)
 
+        _quick_wraps(wrapper, fn)
         _set_original(wrapper, fn)
         return wrapper
 
@@ -29,19 +86,13 @@ def requires(pred: Callable[..., bool]) -> Callable[[Callable[..., Any]], Callab
 
 def ensures(pred: Callable[..., bool]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
-        _bundle(fn)["ensures"].append(pred)
-
-        @functools.wraps(fn)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            ok, err = _check_requires(fn, args, kwargs)
-            if not ok:
-                raise AssertionError(f"Precondition failed for {_qualified_name(_root_original(fn))}: {err}")
-            result = fn(*args, **kwargs)
-            ok2, err2 = _check_ensures(fn, args, kwargs, result)
-            if not ok2:
-                raise AssertionError(f"Postcondition failed for {_qualified_name(_root_original(fn))}: {err2}")
-            return result
+        b = _bundle(fn)
+        reqs = b["requires"]
+        ens = b["ensures"]
+        ens.append(pred)
+        qname = _qualified_name(_root_original(fn))
 
+        wrapper = _wrap_contracts(fn, reqs, ens, qname) if reqs else _wrap_ensures_only(fn, ens, qname)
         _set_original(wrapper, fn)
         return wrapper
 
@@ -91,12 +142,17 @@ def pure(
     return _apply
 
 
+# Resolved eq= shorthands, so repeated @against(eq="approx") skips the import machinery
+_EQ_CACHE: dict[str, Callable[[Any, Any], bool]] = {}
+
+
 def against(
     spec_fn: Callable[..., Any],
     *,
     eq: Callable[[Any, Any], bool] | str | None = None,
     max_examples: int = 200,
     deadline_ms: int | None = None,
+    vectorized: bool = False,
     suppress_health_checks: tuple[HealthCheck, ...] = (
         HealthCheck.too_slow,
         HealthCheck.filter_too_much,
@@ -105,8 +161,10 @@ def against(
     # Resolve eq="approx" shorthand
     resolved_eq = eq
     if isinstance(eq, str):
-        from evidence._numeric import resolve_eq
-        resolved_eq = resolve_eq(eq)
+        resolved_eq = _EQ_CACHE.get(eq)
+        if resolved_eq is None:
+            from evidence._numeric import resolve_eq
+            resolved_eq = _EQ_CACHE[eq] = resolve_eq(eq)
 
     def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
         _bundle(fn)["against"] = {
@@ -114,6 +172,7 @@ def against(
             "eq": resolved_eq,
             "max_examples": max_examples,
             "deadline_ms": deadline_ms,
+            "vectorized": vectorized,
             "suppress_health_checks": suppress_health_checks,
         }
         return fn
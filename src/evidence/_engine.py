@@ -1,20 +1,35 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import importlib
-import json
+import inspect
+import itertools
+import operator
 import os
-import time
-from collections.abc import Callable
+import textwrap
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Any
 
-from hypothesis import assume, find, given, settings
+from hypothesis import HealthCheck, Phase, assume, given, settings
+from hypothesis import strategies as st
+from hypothesis.database import DirectoryBasedExampleDatabase, ExampleDatabase
 from hypothesis.errors import FailedHealthCheck, NoSuchExample
 
-from evidence._bundle import _BUNDLE_ATTR, _check_ensures, _check_requires, _get_bundle, _root_original
+from evidence._bundle import (
+    _BUNDLE_ATTR,
+    _ORIGINAL_ATTR,
+    _check_ensures,
+    _check_requires,
+    _get_bundle,
+    _root_original,
+)
 from evidence._purity import dynamic_purity_check, static_purity_check
-from evidence._strategies import _find_satisfying_kwargs, _strategy_for_function
-from evidence._util import _ensure_dir, _jsonable, _now_iso, _qualified_name
+from evidence._strategies import _find_satisfying_kwargs, _satisfying_batch, _strategy_for_function
+from evidence._util import _deep_clone, _ensure_dir, _json_dumps, _jsonable, _now_iso, _qualified_name, _Stopwatch
 
 
 @dataclasses.dataclass
@@ -35,60 +50,475 @@ class ObligationResult:
         }
 
 
-def _collect_functions(module: Any) -> list[Callable[..., Any]]:
-    fns: list[Callable[..., Any]] = []
-    for _name, obj in vars(module).items():
-        if callable(obj) and hasattr(_root_original(obj), _BUNDLE_ATTR):
-            fns.append(obj)
-    return fns
+# Strategies per (root, max_list_size), shared by every phase of one check_module run
+_STRATEGY_CACHE: dict[tuple[Callable[..., Any], int], Any] = {}
 
 
-def _find_counterexample(
-    impl_root: Callable[..., Any],
-    spec_fn: Callable[..., Any],
-    eq: Callable[[Any, Any], bool],
-    *,
-    max_list_size: int,
-) -> dict[str, Any] | None:
-    strat_kwargs = _strategy_for_function(impl_root, max_list_size=max_list_size)
+def _cached_strategy(root: Callable[..., Any], max_list_size: int) -> Any:
+    key = (root, max_list_size)
+    strat = _STRATEGY_CACHE.get(key)
+    if strat is None:
+        strat = _STRATEGY_CACHE[key] = _strategy_for_function(root, max_list_size=max_list_size)
+    return strat
+
+
+# Inputs per call when @against(vectorized=True) stacks examples into arrays
+_VECTOR_BATCH = 128
+
 
-    def fails(kwargs: dict[str, Any]) -> bool:
-        ok_pre, _ = _check_requires(impl_root, (), kwargs)
-        if not ok_pre:
-            return False
+def _source_files(module: Any, roots: list[Callable[..., Any]]) -> list[str]:
+    """The module's file plus those defining its collected functions, which may be re-exported."""
+    files = {module.__file__} if getattr(module, "__file__", None) else set()
+    for root in roots:
         try:
-            impl_r = impl_root(**kwargs)
-            ok_post, _ = _check_ensures(impl_root, (), kwargs, impl_r)
-            if not ok_post:
-                return True
-            spec_r = spec_fn(**kwargs)
-            return not eq(impl_r, spec_r)
-        except Exception:
-            return True
+            path = inspect.getsourcefile(root)
+        except TypeError:
+            path = None
+        if path:
+            files.add(path)
+    return sorted(files)
 
-    try:
-        kwargs = find(strat_kwargs, fails)
-    except NoSuchExample:
-        return None
 
+def _collect_functions(module: Any) -> list[Callable[..., Any]]:
+    # Decorated wrappers carry the bundle themselves; only bare wrapper chains need the root walk,
+    # so imported library callables are rejected by two attribute probes.
+    return [
+        obj
+        for obj in vars(module).values()
+        if callable(obj)
+        and (
+            hasattr(obj, _BUNDLE_ATTR)
+            or (hasattr(obj, _ORIGINAL_ATTR) and hasattr(_root_original(obj), _BUNDLE_ATTR))
+        )
+    ]
+
+
+def _check_function(
+    fn: Callable[..., Any],
+    *,
+    max_list_size: int,
+    smoke_max_list_size: int,
+    database: ExampleDatabase | None = None,
+) -> list[ObligationResult]:
+    """Run the smoke, purity and spec-equivalence obligations for one function.
+
+    ``database`` persists the equivalence search's examples across runs; None disables it.
+    """
+    out: list[ObligationResult] = []
+    root = _root_original(fn)
+    b = _get_bundle(root)
+    qn = _qualified_name(root)
+
+    # 1) Smoke: satisfiable requires + ensures on one satisfying input
+    t0 = _Stopwatch()
+    # The smoke input, reused by the dynamic purity check; copied before the call can mutate it
+    pure_kwargs: dict[str, Any] | None = None
     try:
-        impl_r = impl_root(**kwargs)
-        ok_post, post_err = _check_ensures(impl_root, (), kwargs, impl_r)
+        smoke_strat = _cached_strategy(root, smoke_max_list_size)
+        example_kwargs = _find_satisfying_kwargs(root, smoke_strat)
+        if b["pure"] is not None:
+            pure_kwargs = _deep_clone(example_kwargs)
+        r = root(**example_kwargs)
+        ok_post, post_err = _check_ensures(root, (), example_kwargs, r)
         if not ok_post:
-            return {
-                "kwargs": _jsonable(kwargs),
-                "impl_result": _jsonable(impl_r),
-                "spec_result": None,
-                "note": f"ensures failed: {post_err}",
-            }
-        spec_r = spec_fn(**kwargs)
-        return {
-            "kwargs": _jsonable(kwargs),
-            "impl_result": _jsonable(impl_r),
-            "spec_result": _jsonable(spec_r),
-        }
+            out.append(
+                ObligationResult(
+                    qn,
+                    "ensures_holds_on_smoke",
+                    "fail",
+                    {"example": _jsonable(example_kwargs), "result": _jsonable(r), "error": post_err},
+                    duration_s=t0.elapsed,
+                )
+            )
+        else:
+            out.append(
+                ObligationResult(
+                    qn,
+                    "contracts_smoke",
+                    "pass",
+                    {
+                        "example": _jsonable(example_kwargs),
+                        "requires": len(b["requires"]),
+                        "ensures": len(b["ensures"]),
+                    },
+                    duration_s=t0.elapsed,
+                )
+            )
+    except NoSuchExample:
+        out.append(ObligationResult(
+            qn, "requires_satisfiable", "fail",
+            {"error": "No satisfying input found"},
+            duration_s=t0.elapsed,
+        ))
+        return out
     except Exception as e:
-        return {"kwargs": _jsonable(kwargs), "error": f"{type(e).__name__}: {e}"}
+        out.append(ObligationResult(
+            qn, "contracts_smoke", "error",
+            {"error": f"{type(e).__name__}: {e}"},
+            duration_s=t0.elapsed,
+        ))
+
+    # 2) Purity check (if @pure is present)
+    if b["pure"] is not None:
+        pure_cfg = b["pure"]
+        is_seed_det = pure_cfg.get("seed") is not None
+        pure_eq = pure_cfg.get("eq")
+        mode_label = "seed-deterministic" if is_seed_det else "strict"
+
+        tp = _Stopwatch()
+        # Static analysis (skip nondeterminism warnings for seed-deterministic)
+        static_warnings = static_purity_check(root, seed_deterministic=is_seed_det)
+        if static_warnings:
+            out.append(ObligationResult(
+                qn, "pure_static", "fail",
+                {"mode": mode_label, "warnings": [repr(w) for w in static_warnings]},
+                duration_s=tp.elapsed,
+            ))
+        else:
+            out.append(ObligationResult(
+                qn, "pure_static", "pass",
+                {"mode": mode_label, "message": "no impure operations detected"},
+                duration_s=tp.elapsed,
+            ))
+
+        # Dynamic analysis: call twice with identical inputs, assert outputs match
+        tp2 = _Stopwatch()
+        try:
+            dyn_kwargs = pure_kwargs
+            if dyn_kwargs is None:
+                dyn_kwargs = _find_satisfying_kwargs(root, _cached_strategy(root, smoke_max_list_size))
+            is_pure, pure_err = dynamic_purity_check(
+                root, dyn_kwargs,
+                seed=pure_cfg.get("seed"),
+                eq=pure_eq,
+            )
+            if is_pure:
+                out.append(ObligationResult(
+                    qn, "pure_dynamic", "pass",
+                    {"mode": mode_label, "example": _jsonable(dyn_kwargs)},
+                    duration_s=tp2.elapsed,
+                ))
+            else:
+                out.append(ObligationResult(
+                    qn, "pure_dynamic", "fail",
+                    {"mode": mode_label, "example": _jsonable(dyn_kwargs), "error": pure_err},
+                    duration_s=tp2.elapsed,
+                ))
+        except Exception as e:
+            out.append(ObligationResult(
+                qn, "pure_dynamic", "error",
+                {"mode": mode_label, "error": f"{type(e).__name__}: {e}"},
+                duration_s=tp2.elapsed,
+            ))
+
+    # 3) Spec equivalence
+    t1 = _Stopwatch()
+    if b["against"] is not None and b["against"]["spec"] is not None:
+        spec_fn = b["against"]["spec"]
+        vectorized = bool(b["against"].get("vectorized"))
+        if vectorized:
+            from evidence._numeric import vectorizable
+            vectorized = vectorizable(root)
+        eq = b["against"]["eq"]
+        if eq is None and vectorized:
+            from evidence._numeric import batch_equal
+            eq = batch_equal
+        eq = eq or operator.eq
+        max_examples = int(b["against"]["max_examples"])
+        deadline_ms = b["against"]["deadline_ms"]
+        suppress_hc = b["against"]["suppress_health_checks"]
+
+        # A single randomized pass; Hypothesis shrinks whatever it finds, so no separate find() probe
+        strat_kwargs = _cached_strategy(root, max_list_size)
+
+        # Mutable container to capture the shrunk counterexample from Hypothesis
+        shrunk_ce: list[dict[str, Any] | None] = [None]
+
+        def run_equiv(
+            _root: Callable[..., Any] = root,
+            _spec_fn: Callable[..., Any] = spec_fn,
+            _eq: Callable[[Any, Any], bool] = eq,
+            _max_examples: int = max_examples,
+            _deadline_ms: int | None = deadline_ms,
+            _suppress_hc: tuple[Any, ...] = suppress_hc,
+            _strat_kwargs: Any = strat_kwargs,
+            _shrunk_ce: list[dict[str, Any] | None] = shrunk_ce,
+            _database: ExampleDatabase | None = database,
+            _vectorized: bool = vectorized,
+            _has_ensures: bool = bool(b["ensures"]),
+        ) -> None:
+            equiv_settings = settings(
+                max_examples=_max_examples,
+                deadline=_deadline_ms,
+                suppress_health_check=list(_suppress_hc),
+                derandomize=False,
+                database=_database,
+                # Impl errors, ensures and spec mismatches are distinct bugs to Hypothesis; report the smallest
+                report_multiple_bugs=False,
+            )
+
+            def check_one(kwargs: dict[str, Any]) -> None:
+                try:
+                    impl_r = _root(**kwargs)
+                    ok_post, post_err = _check_ensures(_root, (), kwargs, impl_r)
+                    spec_r = _spec_fn(**kwargs) if ok_post else None
+                    same = ok_post and _eq(impl_r, spec_r)
+                except Exception as e:
+                    # Raising impl/spec/eq is a counterexample too, not an error in the check itself
+                    err = f"{type(e).__name__}: {e}"
+                    _shrunk_ce[0] = {"kwargs": _jsonable(kwargs), "error": err}
+                    raise AssertionError(err) from e
+
+                if not ok_post:
+                    # Capture shrunk counterexample before raising
+                    _shrunk_ce[0] = {
+                        "kwargs": _jsonable(kwargs),
+                        "impl_result": _jsonable(impl_r),
+                        "spec_result": None,
+                        "note": f"ensures failed: {post_err}",
+                    }
+                    raise AssertionError(f"ensures failed: {post_err}")
+
+                if not same:
+                    # Capture shrunk counterexample before raising
+                    _shrunk_ce[0] = {
+                        "kwargs": _jsonable(kwargs),
+                        "impl_result": _jsonable(impl_r),
+                        "spec_result": _jsonable(spec_r),
+                    }
+                    raise AssertionError("impl != spec")
+
+            def prop(kwargs: dict[str, Any]) -> None:
+                ok_pre, _ = _check_requires(_root, (), kwargs)
+                assume(ok_pre)
+                check_one(kwargs)
+
+            def prop_batch(batch: list[dict[str, Any]]) -> None:
+                from evidence._numeric import first_mismatch, stack_kwargs, unstack
+
+                rows = [kw for kw in batch if _check_requires(_root, (), kw)[0]]
+                assume(rows)
+                stacked = stack_kwargs(rows)
+                if stacked is None:
+                    for kwargs in rows:
+                        check_one(kwargs)
+                    return
+                try:
+                    impl_r = _root(**stacked)
+                    # Postconditions are per input, so they see each row's scalar arguments and result
+                    impl_rows = unstack(impl_r, len(rows)) if _has_ensures else []
+                    spec_r = _spec_fn(**stacked)
+                    same = _eq(impl_r, spec_r)
+                except Exception as e:
+                    # Not attributable to one row; report the batch's first input
+                    err = f"{type(e).__name__}: {e}"
+                    _shrunk_ce[0] = {"kwargs": _jsonable(rows[0]), "batch_size": len(rows), "error": err}
+                    raise AssertionError(err) from e
+                for kwargs, row_r in zip(rows, impl_rows, strict=False):
+                    ok_post, post_err = _check_ensures(_root, (), kwargs, row_r)
+                    if not ok_post:
+                        _shrunk_ce[0] = {
+                            "kwargs": _jsonable(kwargs),
+                            "impl_result": _jsonable(row_r.tolist()),
+                            "spec_result": None,
+                            "note": f"ensures failed: {post_err}",
+                            "batch_size": len(rows),
+                        }
+                        raise AssertionError(f"ensures failed: {post_err}")
+                if not same:
+                    i, impl_row, spec_row = first_mismatch(impl_r, spec_r)
+                    _shrunk_ce[0] = {
+                        "kwargs": _jsonable(rows[i]),
+                        "impl_result": _jsonable(impl_row),
+                        "spec_result": _jsonable(spec_row),
+                        "batch_size": len(rows),
+                    }
+                    raise AssertionError("impl != spec")
+
+            if _vectorized:
+                batches = st.lists(_strat_kwargs, min_size=_VECTOR_BATCH, max_size=_VECTOR_BATCH)
+                # max_examples counts inputs, so run just enough batches to cover them. A batch is one
+                # large example to Hypothesis, and explaining a failure replays every element of it
+                batch_settings = settings(
+                    equiv_settings,
+                    max_examples=-(-_max_examples // _VECTOR_BATCH),
+                    suppress_health_check=[
+                        *_suppress_hc, HealthCheck.large_base_example, HealthCheck.data_too_large,
+                    ],
+                    phases=[p for p in Phase if p is not Phase.explain],
+                )
+                batch_settings(given(batches)(prop_batch))()
+            else:
+                equiv_settings(given(_strat_kwargs)(prop))()
+
+        try:
+            run_equiv()
+            out.append(
+                ObligationResult(
+                    qn,
+                    "equiv_to_spec",
+                    "pass",
+                    {
+                        "spec": _qualified_name(spec_fn),
+                        "max_examples": max_examples,
+                        "requires": len(b["requires"]),
+                        "ensures": len(b["ensures"]),
+                    },
+                    duration_s=t1.elapsed,
+                )
+            )
+        except FailedHealthCheck as e:
+            out.append(
+                ObligationResult(
+                    qn,
+                    "equiv_to_spec",
+                    "fail",
+                    {"spec": _qualified_name(spec_fn), "error": f"FailedHealthCheck: {e}"},
+                    duration_s=t1.elapsed,
+                )
+            )
+        except AssertionError as e:
+            out.append(
+                ObligationResult(
+                    qn,
+                    "equiv_to_spec",
+                    "fail",
+                    {"spec": _qualified_name(spec_fn), "error": str(e), "counterexample": shrunk_ce[0]},
+                    duration_s=t1.elapsed,
+                )
+            )
+        except Exception as e:
+            out.append(
+                ObligationResult(
+                    qn,
+                    "equiv_to_spec",
+                    "error",
+                    {"spec": _qualified_name(spec_fn), "error": f"{type(e).__name__}: {e}"},
+                    duration_s=t1.elapsed,
+                )
+            )
+    else:
+        out.append(ObligationResult(
+            qn, "equiv_to_spec", "skip",
+            {"reason": "no @against(spec) attached"},
+            duration_s=0.0,
+        ))
+
+    return out
+
+
+def _init_worker() -> None:
+    # Hypothesis' example database is not safe to share between concurrent worker processes
+    settings.register_profile("evidence-worker", database=None)
+    settings.load_profile("evidence-worker")
+
+
+def _check_function_at(
+    module_name: str,
+    index: int,
+    max_list_size: int,
+    smoke_max_list_size: int,
+) -> list[ObligationResult]:
+    """Worker entry point: functions are located by position since they cannot be pickled."""
+    module = importlib.import_module(module_name)
+    fn = _collect_functions(module)[index]
+    return _check_function(fn, max_list_size=max_list_size, smoke_max_list_size=smoke_max_list_size)
+
+
+def _mutation_oracle(
+    b: dict[str, Any],
+) -> tuple[Callable[..., Any] | None, Callable[[Any, Any], bool] | None]:
+    """The spec and equality a mutant's outputs are compared with; both None without @against."""
+    spec_cfg = b.get("against")
+    if not spec_cfg:
+        return None, None
+    return spec_cfg["spec"], spec_cfg.get("eq") or operator.eq
+
+
+def _eval_mutant(
+    m: Any,
+    root: Callable[..., Any],
+    spec_fn: Callable[..., Any] | None,
+    eq_fn: Callable[[Any, Any], bool] | None,
+    batch: list[dict[str, Any]] | None,
+) -> str:
+    """Run one mutant over the shared input batch: "killed", "survived" or "error".
+
+    A batch of None (no input satisfies requires) counts the mutant as killed.
+    """
+    from evidence._mutate import compile_mutant
+
+    mutated = compile_mutant(m, root)
+    if mutated is None:
+        return "error"
+    try:
+        caught = batch is None
+        # Check postconditions, stopping at the first input that kills the mutant
+        for kw in batch or ():
+            ex_kw = _deep_clone(kw)  # mutants may mutate their arguments
+            try:
+                mr = mutated(**ex_kw)
+                ok_post, _ = _check_ensures(root, (), ex_kw, mr)
+                if not ok_post:
+                    caught = True
+                elif spec_fn is not None and eq_fn is not None:
+                    sr = spec_fn(**_deep_clone(kw))
+                    if not eq_fn(mr, sr):
+                        caught = True
+            except Exception:
+                caught = True
+            if caught:
+                break
+    except Exception:
+        return "error"
+    return "killed" if caught else "survived"
+
+
+def _eval_mutant_at(module_name: str, index: int, m: Any, batch: list[dict[str, Any]] | None) -> str:
+    """Worker entry point for _eval_mutant; the function is located by position, as in _check_function_at."""
+    module = importlib.import_module(module_name)
+    root = _root_original(_collect_functions(module)[index])
+    spec_fn, eq_fn = _mutation_oracle(_get_bundle(root))
+    return _eval_mutant(m, root, spec_fn, eq_fn, batch)
+
+
+def _infer_structural_at(module_name: str, index: int) -> list[Any]:
+    """Worker entry point for infer_structural; the function is located by position, as in _check_function_at."""
+    from evidence._infer import infer_structural
+
+    module = importlib.import_module(module_name)
+    return infer_structural(_collect_functions(module)[index])
+
+
+def _check_functions(
+    module_name: str,
+    funcs: list[Callable[..., Any]],
+    *,
+    jobs: int,
+    max_list_size: int,
+    smoke_max_list_size: int,
+    database: ExampleDatabase | None,
+) -> Iterator[list[ObligationResult]]:
+    """Yield each function's results in order, fanning out to worker processes when jobs > 1.
+
+    Workers run without ``database``; only the sequential path shares it.
+    """
+    if jobs <= 1 or len(funcs) < 2:
+        for fn in funcs:
+            yield _check_function(
+                fn, max_list_size=max_list_size, smoke_max_list_size=smoke_max_list_size, database=database
+            )
+        return
+
+    n = len(funcs)
+    with ProcessPoolExecutor(max_workers=min(jobs, n), initializer=_init_worker) as pool:
+        yield from pool.map(
+            _check_function_at,
+            [module_name] * n,
+            range(n),
+            [max_list_size] * n,
+            [smoke_max_list_size] * n,
+        )
 
 
 def check_module(
@@ -103,8 +533,17 @@ def check_module(
     prove: bool = False,
     suggest: bool = False,
     infer: bool = False,
+    jobs: int = 1,
+    mutate_batch_size: int = 20,
 ) -> tuple[list[ObligationResult], dict[str, Any]]:
     _ensure_dir(out_dir)
+    # Counterexamples found by earlier runs are replayed first by the equivalence search
+    database = DirectoryBasedExampleDatabase(os.path.join(out_dir, ".hyp_db"))
+    # Registered strategies may have changed since the last run
+    _STRATEGY_CACHE.clear()
+    if jobs == 0:
+        # Half the cores: Hypothesis workers oversubscribe quickly
+        jobs = max(1, (os.cpu_count() or 2) // 2)
 
     # Coverage collector (optional)
     cov_collector = None
@@ -121,463 +560,262 @@ def check_module(
 
     module = importlib.import_module(module_name)
     funcs = _collect_functions(module)
+    # (fn, root, bundle, qualified name), resolved once and shared by every phase below
+    fn_records: list[tuple[Callable[..., Any], Callable[..., Any], dict[str, Any], str]] = []
+    for fn in funcs:
+        root = _root_original(fn)
+        fn_records.append((fn, root, _get_bundle(root), _qualified_name(root)))
+
+    if cov_collector is not None:
+        # Import ran fully traced; checks trace only the files defining the collected functions
+        cov_collector.narrow(_source_files(module, [root for _fn, root, _b, _qn in fn_records]))
 
     results: list[ObligationResult] = []
+    # Latest result per (function, obligation), for phases that read earlier phases' outcomes
+    result_index: dict[tuple[str, str], ObligationResult] = {}
     trust: dict[str, Any] = {"module": module_name, "timestamp": _now_iso(), "functions": []}
 
-    def _emit(result: ObligationResult) -> None:
-        results.append(result)
-        if on_result is not None:
-            on_result(result)
-
-    for fn in funcs:
-        root = _root_original(fn)
-        b = _get_bundle(root)
-        qn = _qualified_name(root)
+    # Results are streamed into the obligations array as they arrive; same layout as json.dump(..., indent=2)
+    obligations_path = os.path.join(out_dir, f"{module_name}.obligations.json")
+    obligations_file = open(obligations_path, "w", encoding="utf-8")  # noqa: SIM115 - closed in the finally below
+    obligations_file.write("[")
 
-        # 1) Smoke: satisfiable requires + ensures on one satisfying input
-        t0 = time.monotonic()
-        try:
-            smoke_strat = _strategy_for_function(root, max_list_size=smoke_max_list_size)
-            example_kwargs = _find_satisfying_kwargs(root, smoke_strat)
-            r = root(**example_kwargs)
-            ok_post, post_err = _check_ensures(root, (), example_kwargs, r)
-            if not ok_post:
-                _emit(
-                    ObligationResult(
-                        qn,
-                        "ensures_holds_on_smoke",
-                        "fail",
-                        {"example": _jsonable(example_kwargs), "result": _jsonable(r), "error": post_err},
-                        duration_s=time.monotonic() - t0,
-                    )
-                )
-            else:
-                _emit(
-                    ObligationResult(
-                        qn,
-                        "contracts_smoke",
-                        "pass",
-                        {
-                            "example": _jsonable(example_kwargs),
-                            "requires": len(b["requires"]),
-                            "ensures": len(b["ensures"]),
-                        },
-                        duration_s=time.monotonic() - t0,
-                    )
-                )
-        except NoSuchExample:
-            _emit(ObligationResult(
-                qn, "requires_satisfiable", "fail",
-                {"error": "No satisfying input found"},
-                duration_s=time.monotonic() - t0,
-            ))
+    try:
+        def _emit(result: ObligationResult) -> None:
+            obligations_file.write(",\n" if results else "\n")
+            obligations_file.write(textwrap.indent(_json_dumps(result.to_json(), indent=True), "  "))
+            obligations_file.flush()
+            results.append(result)
+            result_index[(result.function, result.obligation)] = result
+            if on_result is not None:
+                on_result(result)
+
+        # Coverage is only traced in this process, so measured runs stay sequential
+        per_function = _check_functions(
+            module_name,
+            funcs,
+            jobs=1 if cov_collector is not None else jobs,
+            max_list_size=max_list_size,
+            smoke_max_list_size=smoke_max_list_size,
+            database=database,
+        )
+        for (_fn, _root, _b, qn), fn_results in zip(fn_records, per_function, strict=True):
+            for fn_result in fn_results:
+                _emit(fn_result)
             trust["functions"].append({"function": qn})
-            continue
-        except Exception as e:
-            _emit(ObligationResult(
-                qn, "contracts_smoke", "error",
-                {"error": f"{type(e).__name__}: {e}"},
-                duration_s=time.monotonic() - t0,
-            ))
-
-        # 2) Purity check (if @pure is present)
-        if b["pure"] is not None:
-            pure_cfg = b["pure"]
-            is_seed_det = pure_cfg.get("seed") is not None
-            pure_eq = pure_cfg.get("eq")
-            mode_label = "seed-deterministic" if is_seed_det else "strict"
-
-            tp = time.monotonic()
-            # Static analysis (skip nondeterminism warnings for seed-deterministic)
-            static_warnings = static_purity_check(root, seed_deterministic=is_seed_det)
-            if static_warnings:
-                _emit(ObligationResult(
-                    qn, "pure_static", "fail",
-                    {"mode": mode_label, "warnings": [repr(w) for w in static_warnings]},
-                    duration_s=time.monotonic() - tp,
-                ))
-            else:
-                _emit(ObligationResult(
-                    qn, "pure_static", "pass",
-                    {"mode": mode_label, "message": "no impure operations detected"},
-                    duration_s=time.monotonic() - tp,
-                ))
 
-            # Dynamic analysis: call twice with identical inputs, assert outputs match
-            tp2 = time.monotonic()
-            try:
-                smoke_strat2 = _strategy_for_function(root, max_list_size=smoke_max_list_size)
-                dyn_kwargs = _find_satisfying_kwargs(root, smoke_strat2)
-                is_pure, pure_err = dynamic_purity_check(
-                    root, dyn_kwargs,
-                    seed=pure_cfg.get("seed"),
-                    eq=pure_eq,
-                )
-                if is_pure:
-                    _emit(ObligationResult(
-                        qn, "pure_dynamic", "pass",
-                        {"mode": mode_label, "example": _jsonable(dyn_kwargs)},
-                        duration_s=time.monotonic() - tp2,
-                    ))
-                else:
+        # Stop coverage collection and emit per-function coverage results
+        if cov_collector is not None:
+            cov_collector.stop()
+            reports = cov_collector.report_all([root for _fn, root, _b, _qn in fn_records])
+            for _fn, root, _b, qn in fn_records:
+                report = reports.get(root)
+                if report is not None:
                     _emit(ObligationResult(
-                        qn, "pure_dynamic", "fail",
-                        {"mode": mode_label, "example": _jsonable(dyn_kwargs), "error": pure_err},
-                        duration_s=time.monotonic() - tp2,
+                        qn, "coverage", "pass",
+                        report,
+                        duration_s=0.0,
                     ))
-            except Exception as e:
-                _emit(ObligationResult(
-                    qn, "pure_dynamic", "error",
-                    {"mode": mode_label, "error": f"{type(e).__name__}: {e}"},
-                    duration_s=time.monotonic() - tp2,
-                ))
 
-        # 3) Spec equivalence
-        t1 = time.monotonic()
-        if b["against"] is not None and b["against"]["spec"] is not None:
-            spec_fn = b["against"]["spec"]
-            eq = b["against"]["eq"] or (lambda a, b2: a == b2)
-            max_examples = int(b["against"]["max_examples"])
-            deadline_ms = b["against"]["deadline_ms"]
-            suppress_hc = b["against"]["suppress_health_checks"]
-
-            # ---- deterministic probe first ----
-            ce = _find_counterexample(root, spec_fn, eq, max_list_size=max_list_size)
-            if ce is not None:
-                _emit(
-                    ObligationResult(
-                        qn,
-                        "equiv_to_spec",
-                        "fail",
-                        {
-                            "spec": _qualified_name(spec_fn),
-                            "error": "counterexample found by find()",
-                            "counterexample": ce,
-                        },
-                        duration_s=time.monotonic() - t1,
-                    )
-                )
-                trust["functions"].append({"function": qn})
-                continue
-
-            # ---- if no CE found by find(), do randomized search for confidence ----
-            strat_kwargs = _strategy_for_function(root, max_list_size=max_list_size)
-
-            # Mutable container to capture the shrunk counterexample from Hypothesis
-            shrunk_ce: list[dict[str, Any] | None] = [None]
-
-            def run_equiv(
-                _root: Callable[..., Any] = root,
-                _spec_fn: Callable[..., Any] = spec_fn,
-                _eq: Callable[[Any, Any], bool] = eq,
-                _max_examples: int = max_examples,
-                _deadline_ms: int | None = deadline_ms,
-                _suppress_hc: tuple[Any, ...] = suppress_hc,
-                _strat_kwargs: Any = strat_kwargs,
-                _shrunk_ce: list[dict[str, Any] | None] = shrunk_ce,
-            ) -> None:
-                @settings(
-                    max_examples=_max_examples,
-                    deadline=_deadline_ms,
-                    suppress_health_check=list(_suppress_hc),
-                    derandomize=False,
-                )
-                @given(_strat_kwargs)
-                def prop(kwargs: dict[str, Any]) -> None:
-                    ok_pre, _ = _check_requires(_root, (), kwargs)
-                    assume(ok_pre)
+        # Mutation testing (optional)
+        if mutate:
+            from evidence._mutate import generate_mutants
 
-                    impl_r = _root(**kwargs)
-                    ok_post, post_err = _check_ensures(_root, (), kwargs, impl_r)
-                    if not ok_post:
-                        # Capture shrunk counterexample before raising
-                        _shrunk_ce[0] = {
-                            "kwargs": _jsonable(kwargs),
-                            "impl_result": _jsonable(impl_r),
-                            "spec_result": None,
-                            "note": f"ensures failed: {post_err}",
-                        }
-                        raise AssertionError(f"ensures failed: {post_err}")
+            # Mutants are independent, so with jobs > 1 each function's mutants fan out to worker processes
+            mutate_pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) if jobs > 1 else None
+            with mutate_pool or contextlib.nullcontext():
+                for index, (_fn, root, b, qn) in enumerate(fn_records):
 
-                    spec_r = _spec_fn(**kwargs)
-                    if not _eq(impl_r, spec_r):
-                        # Capture shrunk counterexample before raising
-                        _shrunk_ce[0] = {
-                            "kwargs": _jsonable(kwargs),
-                            "impl_result": _jsonable(impl_r),
-                            "spec_result": _jsonable(spec_r),
-                        }
-                        raise AssertionError("impl != spec")
+                    # Skip spec functions
+                    if b.get("is_spec"):
+                        continue
 
-                prop()
+                    tm = _Stopwatch()
+                    spec_fn, eq_fn = _mutation_oracle(b)
 
-            try:
-                run_equiv()
-                _emit(
-                    ObligationResult(
-                        qn,
-                        "equiv_to_spec",
-                        "pass",
-                        {
-                            "spec": _qualified_name(spec_fn),
-                            "max_examples": max_examples,
-                            "requires": len(b["requires"]),
-                            "ensures": len(b["ensures"]),
-                        },
-                        duration_s=time.monotonic() - t1,
-                    )
-                )
-            except FailedHealthCheck as e:
-                _emit(
-                    ObligationResult(
-                        qn,
-                        "equiv_to_spec",
-                        "fail",
-                        {"spec": _qualified_name(spec_fn), "error": f"FailedHealthCheck: {e}"},
-                        duration_s=time.monotonic() - t1,
-                    )
-                )
-            except AssertionError as e:
-                _emit(
-                    ObligationResult(
-                        qn,
-                        "equiv_to_spec",
-                        "fail",
-                        {"spec": _qualified_name(spec_fn), "error": str(e), "counterexample": shrunk_ce[0]},
-                        duration_s=time.monotonic() - t1,
-                    )
-                )
-            except Exception as e:
-                _emit(
-                    ObligationResult(
-                        qn,
-                        "equiv_to_spec",
-                        "error",
-                        {"spec": _qualified_name(spec_fn), "error": f"{type(e).__name__}: {e}"},
-                        duration_s=time.monotonic() - t1,
-                    )
-                )
-        else:
-            _emit(ObligationResult(
-                qn, "equiv_to_spec", "skip",
-                {"reason": "no @against(spec) attached"},
-                duration_s=0.0,
-            ))
-
-        trust["functions"].append({"function": qn})
-
-    # Stop coverage collection and emit per-function coverage results
-    if cov_collector is not None:
-        cov_collector.stop()
-        for fn in funcs:
-            root = _root_original(fn)
-            qn = _qualified_name(root)
-            report = cov_collector.report_for_function(root)
-            if report is not None:
-                _emit(ObligationResult(
-                    qn, "coverage", "pass",
-                    report,
-                    duration_s=0.0,
-                ))
+                    mutant_list = generate_mutants(root, max_mutants=50)
 
-    # Mutation testing (optional)
-    if mutate:
-        from evidence._mutate import compile_mutant, generate_mutants
-
-        for fn in funcs:
-            root = _root_original(fn)
-            b = _get_bundle(root)
-            qn = _qualified_name(root)
-
-            # Skip spec functions
-            if b.get("is_spec"):
-                continue
-
-            tm = time.monotonic()
-            spec_cfg = b.get("against")
-            spec_fn = spec_cfg["spec"] if spec_cfg else None
-            eq_fn = (spec_cfg.get("eq") or (lambda a, b2: a == b2)) if spec_cfg else None
-
-            mutant_list = generate_mutants(root, max_mutants=50)
-            killed = 0
-            survived = 0
-            errors = 0
-            survivors: list[dict[str, Any]] = []
-
-            for m in mutant_list:
-                mutated = compile_mutant(m, root)
-                if mutated is None:
-                    errors += 1
-                    continue
-                try:
-                    caught = False
-                    # Check postconditions
-                    strat = _strategy_for_function(root, max_list_size=smoke_max_list_size)
+                    # Invariant across mutants; a strategy that cannot be built makes every mutant an error
                     try:
-                        ex_kw = _find_satisfying_kwargs(root, strat)
-                        mr = mutated(**ex_kw)
-                        ok_post, _ = _check_ensures(root, (), ex_kw, mr)
-                        if not ok_post:
-                            caught = True
-                        elif spec_fn is not None and eq_fn is not None:
-                            sr = spec_fn(**ex_kw)
-                            if not eq_fn(mr, sr):
-                                caught = True
+                        strat = _cached_strategy(root, smoke_max_list_size)
                     except Exception:
-                        caught = True
-
-                    if caught:
-                        killed += 1
-                    else:
-                        survived += 1
-                        survivors.append({
-                            "operator": m.operator,
-                            "description": m.description,
-                            "lineno": m.lineno,
-                        })
-                except Exception:
-                    errors += 1
-
-            total_testable = killed + survived
-            score = (killed / total_testable * 100) if total_testable > 0 else None
-            status = "pass" if (score is not None and score >= 80) else "fail" if score is not None else "skip"
-            _emit(ObligationResult(
-                qn, "mutation_score", status,
-                {
-                    "total_mutants": len(mutant_list),
-                    "killed": killed,
-                    "survived": survived,
-                    "errors": errors,
-                    "mutation_score": round(score, 1) if score is not None else None,
-                    "survivors": survivors[:5],  # limit detail output
-                },
-                duration_s=time.monotonic() - tm,
-            ))
-
-    # Symbolic verification (optional)
-    if prove:
-        from evidence._symbolic import prove_function
-
-        for fn in funcs:
-            root = _root_original(fn)
-            b = _get_bundle(root)
-            qn = _qualified_name(root)
-
-            if b.get("is_spec"):
-                continue
-
-            tp = time.monotonic()
-            spec_cfg = b.get("against")
-            s_fn = spec_cfg["spec"] if spec_cfg else None
-            s_eq = (spec_cfg.get("eq") or (lambda a, b2: a == b2)) if spec_cfg else None
-            strat = _strategy_for_function(root, max_list_size=max_list_size)
-
-            result = prove_function(
-                root,
-                spec_fn=s_fn,
-                eq=s_eq,
-                check_requires=_check_requires,
-                check_ensures=_check_ensures,
-                strategy=strat,
-            )
-            status_map = {"verified": "pass", "disproved": "fail", "inconclusive": "skip", "unavailable": "skip"}
-            _emit(ObligationResult(
-                qn, "symbolic_proof", status_map.get(result["status"], "skip"),
-                result,
-                duration_s=time.monotonic() - tp,
-            ))
-
-    # Spec inference (optional)
-    if infer:
-        from evidence._infer import infer_all
-
-        for fn in funcs:
-            root = _root_original(fn)
-            b = _get_bundle(root)
-            qn = _qualified_name(root)
-
-            if b.get("is_spec"):
-                continue
-
-            ti = time.monotonic()
-            # Get mutation score if available
-            mut_score = None
-            for r in results:
-                if r.function == qn and r.obligation == "mutation_score":
-                    mut_score = r.details.get("mutation_score")
-
-            props = infer_all(fn, include_llm=suggest, mutation_score=mut_score)
-            holding = [p.to_dict() for p in props if p.holds]
-            not_holding = [p.to_dict() for p in props if not p.holds]
-
-            _emit(ObligationResult(
-                qn, "inferred_properties", "pass" if holding else "skip",
-                {
-                    "properties_found": len(holding),
-                    "properties_rejected": len(not_holding),
-                    "holding": holding,
-                    "not_holding": not_holding,
-                },
-                duration_s=time.monotonic() - ti,
-            ))
+                        strat = None
+                    # One batch of satisfying inputs, reused by every mutant (None: no input satisfies requires)
+                    batch: list[dict[str, Any]] | None = None
+                    if strat is not None:
+                        try:
+                            batch = _satisfying_batch(root, strat, mutate_batch_size)
+                        except Exception:
+                            batch = None
+
+                    outcomes: list[str] | None = None
+                    if strat is None:
+                        outcomes = ["error"] * len(mutant_list)
+                    elif mutate_pool is not None and len(mutant_list) > 1:
+                        try:
+                            outcomes = list(mutate_pool.map(
+                                _eval_mutant_at,
+                                itertools.repeat(module_name),
+                                itertools.repeat(index),
+                                mutant_list,
+                                itertools.repeat(batch),
+                            ))
+                        except Exception:
+                            outcomes = None  # e.g. inputs that cannot be pickled; evaluate in-process instead
+                    if outcomes is None:
+                        outcomes = [_eval_mutant(m, root, spec_fn, eq_fn, batch) for m in mutant_list]
+
+                    counts = Counter(outcomes)
+                    killed = counts["killed"]
+                    survived = counts["survived"]
+                    errors = counts["error"]
+                    survivors = [
+                        {"operator": m.operator, "description": m.description, "lineno": m.lineno}
+                        for m, outcome in zip(mutant_list, outcomes, strict=True)
+                        if outcome == "survived"
+                    ]
+
+                    total_testable = killed + survived
+                    score = (killed / total_testable * 100) if total_testable > 0 else None
+                    status = "pass" if (score is not None and score >= 80) else "fail" if score is not None else "skip"
+                    _emit(ObligationResult(
+                        qn, "mutation_score", status,
+                        {
+                            "total_mutants": len(mutant_list),
+                            "killed": killed,
+                            "survived": survived,
+                            "errors": errors,
+                            "mutation_score": round(score, 1) if score is not None else None,
+                            "survivors": survivors[:5],  # limit detail output
+                        },
+                        duration_s=tm.elapsed,
+                    ))
 
-    # LLM-assisted spec mining (optional)
-    if suggest:
-        from evidence._suggest import ClaudeSuggester, validate_suggestion
+        # Symbolic verification (optional)
+        if prove:
+            from evidence._symbolic import prove_function
 
-        try:
-            suggester = ClaudeSuggester()
-            for fn in funcs:
-                root = _root_original(fn)
-                b = _get_bundle(root)
-                qn = _qualified_name(root)
+            for _fn, root, b, qn in fn_records:
 
                 if b.get("is_spec"):
                     continue
 
-                ts = time.monotonic()
-                existing = {
-                    "requires": len(b["requires"]),
-                    "ensures": len(b["ensures"]),
-                    "has_spec": b["against"] is not None,
-                }
+                tp = _Stopwatch()
+                spec_cfg = b.get("against")
+                s_fn = spec_cfg["spec"] if spec_cfg else None
+                s_eq = (spec_cfg.get("eq") or operator.eq) if spec_cfg else None
+                strat = _cached_strategy(root, max_list_size)
 
-                # Get mutation score if available from results
-                mut_score = None
-                for r in results:
-                    if r.function == qn and r.obligation == "mutation_score":
-                        mut_score = r.details.get("mutation_score")
-
-                suggestions = suggester.suggest(
+                result = prove_function(
                     root,
-                    existing_contracts=existing,
-                    mutation_score=mut_score,
+                    spec_fn=s_fn,
+                    eq=s_eq,
+                    check_requires=_check_requires,
+                    check_ensures=_check_ensures,
+                    strategy=strat,
                 )
-
-                # Validate each suggestion
-                validated = []
-                for s in suggestions:
-                    valid = validate_suggestion(s, fn)
-                    validated.append({**s.to_dict(), "validated": valid})
-
+                status_map = {"verified": "pass", "disproved": "fail", "inconclusive": "skip", "unavailable": "skip"}
                 _emit(ObligationResult(
-                    qn, "spec_suggestions", "pass" if validated else "skip",
-                    {"suggestions": validated},
-                    duration_s=time.monotonic() - ts,
+                    qn, "symbolic_proof", status_map.get(result["status"], "skip"),
+                    result,
+                    duration_s=tp.elapsed,
                 ))
-        except ImportError:
-            import sys
-            print("warning: anthropic package not installed; install with: pip install evidence[suggest]",
-                  file=sys.stderr)
 
-    obligations_path = os.path.join(out_dir, f"{module_name}.obligations.json")
-    trust_path = os.path.join(out_dir, f"{module_name}.trust.json")
+        # Spec inference (optional)
+        if infer:
+            from evidence._infer import infer_all
+
+            # Functions are independent, so with jobs > 1 their structural inference runs in worker processes
+            infer_pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) if jobs > 1 else None
+            with infer_pool or contextlib.nullcontext():
+                pending = {
+                    index: infer_pool.submit(_infer_structural_at, module_name, index)
+                    for index, (_fn, _root, b, _qn) in enumerate(fn_records)
+                    if not b.get("is_spec")
+                } if infer_pool is not None and len(fn_records) > 1 else {}
+
+                for index, (fn, _root, b, qn) in enumerate(fn_records):
+
+                    if b.get("is_spec"):
+                        continue
+
+                    ti = _Stopwatch()
+                    # Get mutation score if available
+                    mut_result = result_index.get((qn, "mutation_score"))
+                    mut_score = mut_result.details.get("mutation_score") if mut_result else None
+
+                    structural = None
+                    if index in pending:
+                        try:
+                            structural = pending[index].result()
+                        except Exception:
+                            structural = None  # e.g. a function that cannot be located by index; infer in-process
+                    props = infer_all(fn, include_llm=suggest, mutation_score=mut_score, structural=structural)
+                    holding = [p.to_dict() for p in props if p.holds]
+                    not_holding = [p.to_dict() for p in props if not p.holds]
 
-    with open(obligations_path, "w", encoding="utf-8") as f:
-        json.dump([r.to_json() for r in results], f, indent=2)
+                    _emit(ObligationResult(
+                        qn, "inferred_properties", "pass" if holding else "skip",
+                        {
+                            "properties_found": len(holding),
+                            "properties_rejected": len(not_holding),
+                            "holding": holding,
+                            "not_holding": not_holding,
+                        },
+                        duration_s=ti.elapsed,
+                    ))
+
+        # LLM-assisted spec mining (optional)
+        if suggest:
+            from evidence._suggest import ClaudeSuggester, validate_suggestion
 
-    with open(trust_path, "w", encoding="utf-8") as f:
-        json.dump(trust, f, indent=2)
+            try:
+                suggester = ClaudeSuggester()
+                for fn, root, b, qn in fn_records:
+
+                    if b.get("is_spec"):
+                        continue
+
+                    ts = _Stopwatch()
+                    existing = {
+                        "requires": len(b["requires"]),
+                        "ensures": len(b["ensures"]),
+                        "has_spec": b["against"] is not None,
+                    }
+
+                    # Get mutation score if available from results
+                    mut_result = result_index.get((qn, "mutation_score"))
+                    mut_score = mut_result.details.get("mutation_score") if mut_result else None
+
+                    suggestions = suggester.suggest(
+                        root,
+                        existing_contracts=existing,
+                        mutation_score=mut_score,
+                    )
+
+                    # Validate each suggestion
+                    validated = []
+                    for s in suggestions:
+                        valid = validate_suggestion(s, fn)
+                        validated.append({**s.to_dict(), "validated": valid})
+
+                    _emit(ObligationResult(
+                        qn, "spec_suggestions", "pass" if validated else "skip",
+                        {"suggestions": validated},
+                        duration_s=ts.elapsed,
+                    ))
+            except ImportError:
+                import sys
+                print("warning: anthropic package not installed; install with: pip install evidence[suggest]",
+                      file=sys.stderr)
+    finally:
+        # Close the array even when a phase raises, so the report on disk stays valid JSON
+        obligations_file.write("\n]" if results else "]")
+        obligations_file.close()
+        # Drop references to this module's functions and strategies
+        _STRATEGY_CACHE.clear()
+
+    # Formatted in full first, then written with a single call
+    Path(out_dir, f"{module_name}.trust.json").write_text(_json_dumps(trust, indent=True), encoding="utf-8")
 
     return results, trust
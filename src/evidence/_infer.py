@@ -12,15 +12,17 @@ No extra dependencies for structural inference.
 
 from __future__ import annotations
 
+import contextlib
 import inspect
+import operator
 import re
 from collections.abc import Callable
 from typing import Any
 
-from hypothesis import HealthCheck, assume, given, settings
+from hypothesis import HealthCheck, Phase, assume, given, settings
 
 from evidence._bundle import _check_requires, _root_original
-from evidence._strategies import _strategy_for_function
+from evidence._strategies import _has_real_inputs, _strategy_for_function
 
 
 class InferredProperty:
@@ -54,31 +56,62 @@ def _quick_check(
 
     Returns True if no counterexample found.
     """
+    return _quick_check_all(fn, [predicate], max_list_size=max_list_size, max_examples=max_examples)[0]
+
+
+def _quick_check_all(
+    fn: Callable[..., Any],
+    predicates: list[Callable[[dict[str, Any], Any], bool]],
+    *,
+    max_list_size: int = 10,
+    max_examples: int = 200,
+) -> list[bool]:
+    """Check several predicates against one shared run of examples.
+
+    The strategy is built, and the function called, once per example for all
+    predicates; a predicate that fails (or raises) is dropped from the rest
+    of the run. Returns whether each predicate held, in order.
+    """
+    if not predicates:
+        return []
     root = _root_original(fn)
-    strat = _strategy_for_function(root, max_list_size=max_list_size)
+    holds = [True] * len(predicates)
+    live = list(range(len(predicates)))
 
     try:
+        strat = _strategy_for_function(root, max_list_size=max_list_size)
+
+        # Only generation: nothing is replayed from or saved to the example database, and nothing shrunk
         @settings(
             max_examples=max_examples,
             deadline=None,
+            database=None,
+            phases=[Phase.generate],
             suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much],
         )
         @given(strat)
         def prop(kwargs: dict[str, Any]) -> None:
+            if not live:
+                return  # every predicate already has a counterexample
             ok_pre, _ = _check_requires(root, (), kwargs)
             assume(ok_pre)
             try:
                 result = root(**kwargs)
             except Exception:
                 return  # skip if function errors
-            assert predicate(kwargs, result)
+            for i in list(live):
+                try:
+                    ok = predicates[i](kwargs, result)
+                except Exception:
+                    ok = False
+                if not ok:
+                    holds[i] = False
+                    live.remove(i)
 
         prop()
-        return True
-    except AssertionError:
-        return False
+        return holds
     except Exception:
-        return False
+        return [False] * len(predicates)
 
 
 def infer_structural(fn: Callable[..., Any]) -> list[InferredProperty]:
@@ -93,7 +126,6 @@ def infer_structural(fn: Callable[..., Any]) -> list[InferredProperty]:
     - Sortedness: output is sorted (for list outputs)
     """
     root = _root_original(fn)
-    properties: list[InferredProperty] = []
 
     # Get type hints to determine what checks make sense
     hints = {}
@@ -106,6 +138,8 @@ def infer_structural(fn: Callable[..., Any]) -> list[InferredProperty]:
 
     ret_type = hints.get("return")
     param_types = {k: v for k, v in hints.items() if k != "return"}
+    if not param_types:
+        return []  # no annotated parameters, so no check below applies
 
     # Check if it's a list -> list function
     is_list_to_list = False
@@ -117,86 +151,99 @@ def infer_structural(fn: Callable[..., Any]) -> list[InferredProperty]:
                     is_list_to_list = True
                     break
 
+    # (property name, description, predicate over (kwargs, result))
+    checks: list[tuple[str, str, Callable[[dict[str, Any], Any], bool]]] = []
+
     # Shape preservation (list -> list)
     if is_list_to_list:
         list_params = [k for k, v in param_types.items() if "list" in str(v).lower()]
         if len(list_params) == 1:
             param = list_params[0]
-            holds = _quick_check(fn, lambda kw, r: isinstance(r, list) and len(r) == len(kw.get(param, [])))
-            properties.append(InferredProperty(
+            checks.append((
                 "shape_preservation",
                 f"len(result) == len({param})",
-                holds,
+                lambda kw, r: isinstance(r, list) and len(r) == len(kw.get(param, [])),
             ))
 
     # Sortedness (for list outputs)
     if is_list_to_list:
-        holds = _quick_check(
-            fn,
-            lambda kw, r: isinstance(r, list) and (
-                len(r) <= 1 or all(r[i] <= r[i + 1] for i in range(len(r) - 1))
-            ),
-        )
-        properties.append(InferredProperty(
+        checks.append((
             "sortedness",
             "output is sorted",
-            holds,
+            lambda kw, r: isinstance(r, list) and all(map(operator.le, r, r[1:])),
         ))
 
-    # Idempotence: f(f(x)) == f(x)
-    # Only for single-arg functions where input and output types match
+    # Idempotence: f(f(x)) == f(x) and involution: f(f(x)) == x
+    # Only for single-arg functions where input and output types match.
+    # Both need f(f(x)), so it is computed once per example and shared; while
+    # idempotence holds, involution amounts to f(x) == x at no extra call.
     if len(param_types) == 1:
         param_name = next(iter(param_types.keys()))
-        try:
-            holds = _quick_check(
-                fn,
-                lambda kw, r: _safe_idempotence_check(root, param_name, kw, r),
-            )
-            properties.append(InferredProperty(
-                "idempotence",
-                "f(f(x)) == f(x)",
-                holds,
-            ))
-        except Exception:
-            pass
+        twice = _reapply(root, param_name)
+        checks.append((
+            "idempotence",
+            "f(f(x)) == f(x)",
+            lambda kw, r: _safe_idempotence_check(twice(kw, r), r),
+        ))
+        checks.append((
+            "involution",
+            "f(f(x)) == x",
+            lambda kw, r: _safe_involution_check(twice(kw, r), kw[param_name]),
+        ))
 
-    # Involution: f(f(x)) == x
-    if len(param_types) == 1:
-        param_name = next(iter(param_types.keys()))
-        try:
-            holds = _quick_check(
-                fn,
-                lambda kw, r: _safe_involution_check(root, param_name, kw, r),
-            )
-            properties.append(InferredProperty(
-                "involution",
-                "f(f(x)) == x",
-                holds,
-            ))
-        except Exception:
-            pass
+    # Parameters of unsupported types are all drawn as None; such runs say nothing about the function
+    with contextlib.suppress(Exception):
+        if checks and not _has_real_inputs(root, max_list_size=10):
+            return []
 
-    return properties
+    outcomes = _quick_check_all(fn, [predicate for _name, _desc, predicate in checks])
+    return [
+        InferredProperty(name, description, holds)
+        for (name, description, _predicate), holds in zip(checks, outcomes, strict=True)
+    ]
 
 
-def _safe_idempotence_check(
-    fn: Callable[..., Any], param_name: str, kwargs: dict[str, Any], result: Any
-) -> bool:
+# Stands in for f(f(x)) when the second application raised
+_RAISED = object()
+
+
+def _reapply(fn: Callable[..., Any], param_name: str) -> Callable[[dict[str, Any], Any], Any]:
+    """Return (kwargs, result) -> fn(result), remembering the latest example's call.
+
+    The idempotence and involution predicates run back to back on the same
+    example, so only the first of them calls ``fn``. Yields _RAISED if it raised.
+    """
+    last: list[Any] = [None, None, _RAISED]  # kwargs, result, fn(result)
+
+    def second(kwargs: dict[str, Any], result: Any) -> Any:
+        # Identity of both objects marks one example; holding them keeps their ids from being reused
+        if last[0] is not kwargs or last[1] is not result:
+            try:
+                value = fn(**{param_name: result})
+            except Exception:
+                value = _RAISED
+            last[:] = [kwargs, result, value]
+        return last[2]
+
+    return second
+
+
+def _safe_idempotence_check(second: Any, result: Any) -> bool:
     """Check f(f(x)) == f(x), handling exceptions."""
+    if second is _RAISED:
+        return True  # skip on error
     try:
-        second = fn(**{param_name: result})
         return bool(second == result)
     except Exception:
         return True  # skip on error
 
 
-def _safe_involution_check(
-    fn: Callable[..., Any], param_name: str, kwargs: dict[str, Any], result: Any
-) -> bool:
+def _safe_involution_check(second: Any, original: Any) -> bool:
     """Check f(f(x)) == x, handling exceptions."""
+    if second is _RAISED:
+        return True  # skip on error
     try:
-        second = fn(**{param_name: result})
-        return bool(second == kwargs[param_name])
+        return bool(second == original)
     except Exception:
         return True  # skip on error
 
@@ -221,6 +268,14 @@ _DOCSTRING_PATTERNS = [
 ]
 
 
+# All patterns as one alternation. Each branch is a zero-width lookahead, so a long match
+# (e.g. "returns ... sorted") cannot consume text another pattern would have matched.
+_DOC_RE = re.compile(
+    "|".join(f"(?=(?P<g{i}>{pattern}))" for i, (pattern, _name, _desc) in enumerate(_DOCSTRING_PATTERNS)),
+    re.IGNORECASE,
+)
+
+
 def infer_from_docstring(fn: Callable[..., Any]) -> list[InferredProperty]:
     """Mine contract-like statements from function docstrings."""
     doc = inspect.getdoc(fn) or ""
@@ -231,14 +286,13 @@ def infer_from_docstring(fn: Callable[..., Any]) -> list[InferredProperty]:
     if not doc:
         return []
 
-    properties: list[InferredProperty] = []
-    doc_lower = doc.lower()
-
-    for pattern, name, description in _DOCSTRING_PATTERNS:
-        if re.search(pattern, doc_lower):
-            properties.append(InferredProperty(name, description, True, source="docstring"))
-
-    return properties
+    # One pass over the docstring; report in pattern order, as each pattern matching anywhere counts once
+    found = {int(m.lastgroup[1:]) for m in _DOC_RE.finditer(doc) if m.lastgroup is not None}
+    return [
+        InferredProperty(name, description, True, source="docstring")
+        for i, (_pattern, name, description) in enumerate(_DOCSTRING_PATTERNS)
+        if i in found
+    ]
 
 
 def infer_all(
@@ -246,6 +300,7 @@ def infer_all(
     *,
     include_llm: bool = False,
     mutation_score: float | None = None,
+    structural: list[InferredProperty] | None = None,
 ) -> list[InferredProperty]:
     """Run all inference strategies on a function.
 
@@ -253,6 +308,8 @@ def infer_all(
         fn: The function to analyze.
         include_llm: If True, also use LLM-assisted inference (requires anthropic).
         mutation_score: If available, pass to LLM for targeted suggestions.
+        structural: Structural properties already inferred for ``fn`` (e.g. in a
+            worker process); computed here when None.
 
     Returns:
         Combined list of inferred properties from all strategies.
@@ -260,7 +317,7 @@ def infer_all(
     properties: list[InferredProperty] = []
 
     # 1. Structural inference
-    properties.extend(infer_structural(fn))
+    properties.extend(infer_structural(fn) if structural is None else structural)
 
     # 2. Docstring mining
     properties.extend(infer_from_docstring(fn))
@@ -15,28 +15,75 @@ No external dependencies (stdlib ast only).
 from __future__ import annotations
 
 import ast
+import contextlib
 import copy
 import inspect
+import operator
 import textwrap
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from types import CodeType
 from typing import Any
 
 
 class Mutant:
-    """Represents a single mutation applied to a function."""
+    """Represents a single mutation applied to a function.
 
-    __slots__ = ("description", "lineno", "operator", "tree")
+    Mutants from generate_mutants share one parsed ``tree`` and carry a patch:
+    the target node, the field (and list index) to overwrite, and the
+    replacement. The patch is applied in place only while compiling, so no
+    per-mutant copy of the tree is made. A Mutant built without a patch
+    holds its own, already mutated tree.
+    """
 
-    def __init__(self, operator: str, description: str, lineno: int | None, tree: ast.Module) -> None:
+    __slots__ = ("_key", "_patch", "description", "lineno", "operator", "tree")
+
+    def __init__(
+        self,
+        operator: str,
+        description: str,
+        lineno: int | None,
+        tree: ast.Module,
+        patch: tuple[ast.AST, str, int | None, Any] | None = None,
+        key: tuple[Any, ...] | None = None,
+    ) -> None:
         self.operator = operator
         self.description = description
         self.lineno = lineno
         self.tree = tree
+        self._patch = patch
+        # Identifies the mutation within its function's tree, for the compile cache
+        self._key = key
 
     def __repr__(self) -> str:
         loc = f" (line {self.lineno})" if self.lineno is not None else ""
         return f"Mutant({self.operator}: {self.description}{loc})"
 
+    @contextlib.contextmanager
+    def applied(self) -> Iterator[ast.Module]:
+        """Yield ``tree`` with this mutation applied, restoring the shared tree on exit."""
+        if self._patch is None:
+            yield self.tree
+            return
+        target, field, index, replacement = self._patch
+        if index is None:
+            original = getattr(target, field)
+            setattr(target, field, replacement)
+        else:
+            original = getattr(target, field)[index]
+            getattr(target, field)[index] = replacement
+        try:
+            yield self.tree
+        finally:
+            if index is None:
+                setattr(target, field, original)
+            else:
+                getattr(target, field)[index] = original
+
+    def materialize(self) -> ast.Module:
+        """A standalone copy of the mutated tree, e.g. for reporting a surviving mutant."""
+        with self.applied() as tree:
+            return copy.deepcopy(tree)
+
 
 # ---------- Comparison operator flips ----------
 
@@ -90,7 +137,8 @@ def _get_source_and_tree(fn: Callable[..., Any]) -> tuple[str, ast.Module, int]
 def generate_mutants(fn: Callable[..., Any], *, max_mutants: int = 50) -> list[Mutant]:
     """Generate mutant ASTs for a function.
 
-    Returns at most max_mutants mutants to keep execution bounded.
+    Returns at most max_mutants mutants to keep execution bounded. All of them
+    share the function's parsed tree; see Mutant.applied.
     """
     result = _get_source_and_tree(fn)
     if result is None:
@@ -98,168 +146,110 @@ def generate_mutants(fn: Callable[..., Any], *, max_mutants: int = 50) -> list[M
     _source, tree, _start = result
     mutants: list[Mutant] = []
 
-    # Walk the AST and generate mutations
-    for node in ast.walk(tree):
-        if len(mutants) >= max_mutants:
-            break
-
-        # 1) Flip comparisons
-        if isinstance(node, ast.Compare):
-            for i, op in enumerate(node.ops):
-                if type(op) in _CMP_FLIPS and len(mutants) < max_mutants:
-                    new_tree = copy.deepcopy(tree)
-                    _apply_cmp_flip(new_tree, node, i)
-                    mutants.append(Mutant(
-                        "flip_comparison",
-                        f"{type(op).__name__} -> {_CMP_FLIPS[type(op)].__name__}",
-                        getattr(node, "lineno", None),
-                        new_tree,
-                    ))
-
-        # 2) Swap arithmetic
-        if isinstance(node, ast.BinOp) and type(node.op) in _ARITH_SWAPS and len(mutants) < max_mutants:
-                new_tree = copy.deepcopy(tree)
-                _apply_arith_swap(new_tree, node)
-                mutants.append(Mutant(
-                    "swap_arithmetic",
-                    f"{type(node.op).__name__} -> {_ARITH_SWAPS[type(node.op)].__name__}",
-                    getattr(node, "lineno", None),
-                    new_tree,
-                ))
-
-        # 3) Negate conditions
-        if isinstance(node, ast.If) and len(mutants) < max_mutants:
-                new_tree = copy.deepcopy(tree)
-                _apply_negate_condition(new_tree, node)
-                mutants.append(Mutant(
-                    "negate_condition",
-                    "if cond -> if not cond",
-                    getattr(node, "lineno", None),
-                    new_tree,
-                ))
-
-        # 4) Delete statements (replace with pass)
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            for i, stmt in enumerate(node.body):
-                if len(mutants) >= max_mutants:
-                    break
-                if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                    new_tree = copy.deepcopy(tree)
-                    _apply_delete_stmt(new_tree, node, i)
-                    mutants.append(Mutant(
-                        "delete_statement",
-                        f"delete statement at line {getattr(stmt, 'lineno', '?')}",
-                        getattr(stmt, "lineno", None),
-                        new_tree,
-                    ))
-
-        # 5) Change constants
-        if isinstance(node, ast.Constant) and len(mutants) < max_mutants:
-                new_val = _mutate_constant(node.value)
-                if new_val is not None:
-                    new_tree = copy.deepcopy(tree)
-                    _apply_change_constant(new_tree, node, new_val)
-                    mutants.append(Mutant(
-                        "change_constant",
-                        f"{node.value!r} -> {new_val!r}",
-                        getattr(node, "lineno", None),
-                        new_tree,
-                    ))
-
-        # 6) Swap boolean ops
-        if isinstance(node, ast.BoolOp) and type(node.op) in _BOOL_SWAPS and len(mutants) < max_mutants:
-                new_tree = copy.deepcopy(tree)
-                _apply_bool_swap(new_tree, node)
-                mutants.append(Mutant(
-                    "swap_boolean",
-                    f"{type(node.op).__name__} -> {_BOOL_SWAPS[type(node.op)].__name__}",
-                    getattr(node, "lineno", None),
-                    new_tree,
-                ))
-
-        # 7) Remove return values
-        if isinstance(node, ast.Return) and node.value is not None and len(mutants) < max_mutants:
-                new_tree = copy.deepcopy(tree)
-                _apply_remove_return(new_tree, node)
-                mutants.append(Mutant(
-                    "remove_return",
-                    "return x -> return None",
-                    getattr(node, "lineno", None),
-                    new_tree,
-                ))
+    # Walk the AST breadth-first; each node type has at most one mutator. A node's position in
+    # the walk is the same on every parse of the source, so it names the mutation site
+    for site, node in enumerate(ast.walk(tree)):
+        mutator = _NODE_MUTATORS.get(type(node))
+        if mutator is None:
+            continue
+        for op_name, description, at, target, field, index, new in mutator(node):
+            if len(mutants) >= max_mutants:
+                return mutants
+            current = getattr(target, field) if index is None else getattr(target, field)[index]
+            if _same_node(current, new):
+                continue  # e.g. `return None` -> `return None`: identical to the original, so it can never be killed
+            key = (op_name, site, field, index, type(new).__name__ if isinstance(new, ast.AST) else repr(new))
+            mutants.append(
+                Mutant(op_name, description, getattr(at, "lineno", None), tree, (target, field, index, new), key)
+            )
 
     return mutants
 
 
-def _apply_cmp_flip(tree: ast.Module, target: ast.Compare, idx: int) -> None:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Compare) and _same_loc(node, target):
-            node.ops[idx] = _CMP_FLIPS[type(node.ops[idx])]()
-            return
+# A candidate mutation: (operator, description, node reported for its line, patch target, field, index, replacement)
+_Candidate = tuple[str, str, ast.AST, ast.AST, str, int | None, Any]
 
 
-def _apply_arith_swap(tree: ast.Module, target: ast.BinOp) -> None:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.BinOp) and _same_loc(node, target):
-            node.op = _ARITH_SWAPS[type(node.op)]()
-            return
+def _flip_comparisons(node: ast.Compare) -> Iterator[_Candidate]:
+    for i, op in enumerate(node.ops):
+        flipped = _CMP_FLIPS.get(type(op))
+        if flipped is not None:
+            yield "flip_comparison", f"{type(op).__name__} -> {flipped.__name__}", node, node, "ops", i, flipped()
 
 
-def _apply_negate_condition(tree: ast.Module, target: ast.If) -> None:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.If) and _same_loc(node, target):
-            node.test = ast.UnaryOp(op=ast.Not(), operand=node.test)
-            ast.fix_missing_locations(tree)
-            return
+def _swap_arithmetic(node: ast.BinOp) -> Iterator[_Candidate]:
+    swapped = _ARITH_SWAPS.get(type(node.op))
+    if swapped is not None:
+        yield "swap_arithmetic", f"{type(node.op).__name__} -> {swapped.__name__}", node, node, "op", None, swapped()
 
 
-def _apply_delete_stmt(tree: ast.Module, target_fn: ast.FunctionDef | ast.AsyncFunctionDef, idx: int) -> None:
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _same_loc(node, target_fn):
-            node.body[idx] = ast.Pass()
-            ast.fix_missing_locations(tree)
-            return
+def _negate_condition(node: ast.If) -> Iterator[_Candidate]:
+    negated = ast.copy_location(ast.UnaryOp(op=ast.Not(), operand=node.test), node.test)
+    yield "negate_condition", "if cond -> if not cond", node, node, "test", None, negated
 
 
-def _apply_change_constant(tree: ast.Module, target: ast.Constant, new_val: Any) -> None:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Constant) and _same_loc(node, target) and node.value == target.value:
-            node.value = new_val
-            return
+def _delete_statements(node: ast.FunctionDef | ast.AsyncFunctionDef) -> Iterator[_Candidate]:
+    for i, stmt in enumerate(node.body):
+        if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            yield ("delete_statement", f"delete statement at line {getattr(stmt, 'lineno', '?')}", stmt,
+                   node, "body", i, ast.copy_location(ast.Pass(), stmt))
 
 
-def _apply_bool_swap(tree: ast.Module, target: ast.BoolOp) -> None:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.BoolOp) and _same_loc(node, target):
-            node.op = _BOOL_SWAPS[type(node.op)]()
-            return
+def _change_constant(node: ast.Constant) -> Iterator[_Candidate]:
+    new_val = _mutate_constant(node.value)
+    if new_val is not None:
+        yield "change_constant", f"{node.value!r} -> {new_val!r}", node, node, "value", None, new_val
 
 
-def _apply_remove_return(tree: ast.Module, target: ast.Return) -> None:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Return) and _same_loc(node, target):
-            node.value = ast.Constant(value=None)
-            ast.fix_missing_locations(tree)
-            return
+def _swap_boolean(node: ast.BoolOp) -> Iterator[_Candidate]:
+    swapped = _BOOL_SWAPS.get(type(node.op))
+    if swapped is not None:
+        yield "swap_boolean", f"{type(node.op).__name__} -> {swapped.__name__}", node, node, "op", None, swapped()
+
 
+def _remove_return(node: ast.Return) -> Iterator[_Candidate]:
+    if node.value is not None:
+        none = ast.copy_location(ast.Constant(value=None), node.value)
+        yield "remove_return", "return x -> return None", node, node, "value", None, none
 
-def _same_loc(a: ast.AST, b: ast.AST) -> bool:
-    return (
-        getattr(a, "lineno", None) == getattr(b, "lineno", None)
-        and getattr(a, "col_offset", None) == getattr(b, "col_offset", None)
-    )
+
+# Mutation operators by exact node type, so each visited node costs one dict lookup
+_NODE_MUTATORS: dict[type[ast.AST], Callable[[Any], Iterator[_Candidate]]] = {
+    ast.Compare: _flip_comparisons,
+    ast.BinOp: _swap_arithmetic,
+    ast.If: _negate_condition,
+    ast.FunctionDef: _delete_statements,
+    ast.AsyncFunctionDef: _delete_statements,
+    ast.Constant: _change_constant,
+    ast.BoolOp: _swap_boolean,
+    ast.Return: _remove_return,
+}
+
+
+def _same_node(old: Any, new: Any) -> bool:
+    """Whether a patch would leave the tree structurally unchanged; only subtrees of one type are dumped."""
+    if type(old) is not type(new):
+        return False
+    return ast.dump(old) == ast.dump(new) if isinstance(new, ast.AST) else bool(old == new)
+
+
+# Replacement value by exact constant type; bool is its own key, so True never takes the int path
+_CONST_MUTATORS: dict[type, Callable[[Any], Any]] = {
+    bool: operator.not_,
+    int: lambda v: v + 1,
+    float: lambda v: v + 1.0,
+    str: lambda v: "" if v else None,
+}
 
 
 def _mutate_constant(val: Any) -> Any:
-    if isinstance(val, bool):
-        return not val
-    if isinstance(val, int):
-        return val + 1
-    if isinstance(val, float):
-        return val + 1.0
-    if isinstance(val, str) and val:
-        return ""
-    return None
+    mutator = _CONST_MUTATORS.get(type(val))
+    return mutator(val) if mutator is not None else None
+
+
+# Compiled mutant code by (original code object, mutant key); repeated runs regenerate identical mutants
+_COMPILE_CACHE: dict[tuple[CodeType, tuple[Any, ...]], CodeType] = {}
+_COMPILE_CACHE_MAX = 1024
 
 
 def compile_mutant(mutant: Mutant, fn: Callable[..., Any]) -> Callable[..., Any] | None:
@@ -267,14 +257,28 @@ def compile_mutant(mutant: Mutant, fn: Callable[..., Any]) -> Callable[..., Any]
 
     Returns None if compilation fails.
     """
-    ast.fix_missing_locations(mutant.tree)
-    try:
-        code = compile(mutant.tree, f"<mutant:{mutant.operator}>", "exec")
-    except (SyntaxError, TypeError):
-        return None
+    # Unwrapping e.g. functools.lru_cache; its code keys the cache and its globals run the mutant
+    inner = inspect.unwrap(fn)
+    fn_code = getattr(inner, "__code__", None)
+    # Only mutants from generate_mutants have a key; a caller-built tree is compiled every time
+    key = (fn_code, mutant._key) if fn_code is not None and mutant._key is not None else None
+    code = _COMPILE_CACHE.get(key) if key is not None else None
+    if code is None:
+        with mutant.applied() as tree:
+            if mutant._patch is None:
+                # Patches from generate_mutants carry copied locations; only a caller-built tree may lack them
+                ast.fix_missing_locations(tree)
+            try:
+                code = compile(tree, f"<mutant:{mutant.operator}>", "exec")
+            except (SyntaxError, TypeError):
+                return None
+        if key is not None:
+            if len(_COMPILE_CACHE) >= _COMPILE_CACHE_MAX:
+                _COMPILE_CACHE.clear()
+            _COMPILE_CACHE[key] = code
 
     # Execute in a namespace with the function's globals
-    ns: dict[str, Any] = dict(fn.__globals__) if hasattr(fn, "__globals__") else {}
+    ns: dict[str, Any] = dict(inner.__globals__) if hasattr(inner, "__globals__") else {}
     try:
         exec(code, ns)
     except Exception:
@@ -13,11 +13,90 @@ Requires: pip install evidence[numeric]  (numpy, pandas)
 
 from __future__ import annotations
 
+import functools
 import math
-from collections.abc import Callable
+import operator
+import sys
+from collections.abc import Callable, Sequence
 from typing import Any
 
 
+def _numpy_close(a: Any, b: Any, rtol: float, atol: float) -> bool:
+    np = sys.modules["numpy"]
+    return bool(np.allclose(a, b, rtol=rtol, atol=atol, equal_nan=True))
+
+
+def _torch_close(a: Any, b: Any, rtol: float, atol: float) -> bool:
+    torch = sys.modules["torch"]
+    if not isinstance(a, torch.Tensor):
+        a = torch.tensor(a)
+    if not isinstance(b, torch.Tensor):
+        b = torch.tensor(b)
+    return bool(torch.allclose(a, b, rtol=rtol, atol=atol))
+
+
+def _pandas_close(a: Any, b: Any, rtol: float, atol: float) -> bool:
+    try:
+        return _numpy_close(a.values, b.values, rtol, atol)
+    except Exception:
+        return bool(a.equals(b))
+
+
+# Concrete type -> (precedence, handler), or None for types no array library
+# claims. Filled on first sight of each type by probing sys.modules, never by
+# importing: an ndarray (or a subclass) can only exist once numpy is loaded.
+_DISPATCH: dict[type, tuple[int, Callable[[Any, Any, float, float], bool]] | None] = {}
+
+
+def _handler(tp: type) -> tuple[int, Callable[[Any, Any, float, float], bool]] | None:
+    try:
+        return _DISPATCH[tp]
+    except KeyError:
+        pass
+    np = sys.modules.get("numpy")
+    torch = sys.modules.get("torch")
+    pd = sys.modules.get("pandas")
+    entry: tuple[int, Callable[[Any, Any, float, float], bool]] | None = None
+    if np is not None and issubclass(tp, np.ndarray):
+        entry = (0, _numpy_close)
+    elif torch is not None and issubclass(tp, torch.Tensor):
+        entry = (1, _torch_close)
+    elif pd is not None and issubclass(tp, (pd.Series, pd.DataFrame)):
+        entry = (2, _pandas_close)
+    _DISPATCH[tp] = entry
+    return entry
+
+
+# Shorter sequences compare faster element by element than through numpy
+_VECTOR_MIN_LEN = 100
+
+
+@functools.cache
+def _numpy() -> Any:
+    """numpy, or None when it is not installed; probed once, as failed imports are not cached."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _floats_close(a: Sequence[Any], b: Sequence[Any], rtol: float, atol: float) -> bool | None:
+    """math.isclose over two all-float sequences in one numpy pass; None if either holds a non-float or no numpy."""
+    if not all(type(x) is float for x in a) or not all(type(x) is float for x in b):
+        return None
+    np = _numpy()
+    if np is None:
+        return None
+    x = np.asarray(a, dtype=np.float64)
+    y = np.asarray(b, dtype=np.float64)
+    with np.errstate(invalid="ignore", over="ignore"):
+        diff = np.abs(x - y)
+        tol = np.maximum(rtol * np.maximum(np.abs(x), np.abs(y)), atol)
+        # Equal infinities are close; any other non-finite difference is not, as in math.isclose
+        return bool(np.all((x == y) | (np.isfinite(diff) & (diff <= tol))))
+
+
 def approx_eq(a: Any, b: Any, *, rtol: float = 1e-5, atol: float = 1e-8) -> bool:
     """Approximate equality that auto-dispatches based on type.
 
@@ -29,44 +108,14 @@ def approx_eq(a: Any, b: Any, *, rtol: float = 1e-5, atol: float = 1e-8) -> bool
     - Iterables: recursive element-wise comparison
     - Exact types: ==
     """
-    # numpy array
-    try:
-        import numpy as np
-        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
-            return bool(np.allclose(a, b, rtol=rtol, atol=atol, equal_nan=True))
-    except ImportError:
-        pass
-
-    # torch tensor
-    try:
-        import torch  # type: ignore[import-not-found]
-        if isinstance(a, torch.Tensor) or isinstance(b, torch.Tensor):
-            if not isinstance(a, torch.Tensor):
-                a = torch.tensor(a)
-            if not isinstance(b, torch.Tensor):
-                b = torch.tensor(b)
-            return bool(torch.allclose(a, b, rtol=rtol, atol=atol))
-    except ImportError:
-        pass
-
-    # pandas
-    try:
-        import pandas as pd  # type: ignore[import-untyped]
-        if isinstance(a, (pd.Series, pd.DataFrame)):
-            if isinstance(a, pd.DataFrame):
-                try:
-                    import numpy as np
-                    return bool(np.allclose(a.values, b.values, rtol=rtol, atol=atol, equal_nan=True))
-                except Exception:
-                    return bool(a.equals(b))
-            else:
-                try:
-                    import numpy as np
-                    return bool(np.allclose(a.values, b.values, rtol=rtol, atol=atol, equal_nan=True))
-                except Exception:
-                    return bool(a.equals(b))
-    except ImportError:
-        pass
+    # An array or tensor on either side decides the comparison (numpy first);
+    # pandas only when it is the left operand
+    handler = _handler(type(a))
+    other = _handler(type(b))
+    if other is not None and other[0] < 2 and (handler is None or other[0] < handler[0]):
+        handler = other
+    if handler is not None:
+        return handler[1](a, b, rtol, atol)
 
     # Python float
     if isinstance(a, float) and isinstance(b, float):
@@ -76,6 +125,10 @@ def approx_eq(a: Any, b: Any, *, rtol: float = 1e-5, atol: float = 1e-8) -> bool
     if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
         if len(a) != len(b):
             return False
+        if len(a) >= _VECTOR_MIN_LEN:
+            close = _floats_close(a, b, rtol, atol)
+            if close is not None:
+                return close
         return all(approx_eq(ai, bi, rtol=rtol, atol=atol) for ai, bi in zip(a, b, strict=True))
 
     # Fallback to exact equality
@@ -110,7 +163,7 @@ def register_numeric_strategies() -> None:
 
     # pandas Series
     try:
-        import pandas as pd
+        import pandas as pd  # type: ignore[import-untyped]
         from hypothesis.extra.pandas import series
 
         def pandas_series_factory(*, max_list_size: int = 20, depth: int = 0) -> Any:
@@ -144,7 +197,7 @@ def register_numeric_strategies() -> None:
 
     # torch Tensor
     try:
-        import torch
+        import torch  # type: ignore[import-not-found]
 
         def torch_tensor_factory(*, max_list_size: int = 20, depth: int = 0) -> Any:
             from hypothesis import strategies as st
@@ -169,9 +222,91 @@ def resolve_eq(eq: str | Callable[[Any, Any], bool] | None) -> Callable[[Any, An
         A callable equality function.
     """
     if eq is None:
-        return lambda a, b: a == b
+        return operator.eq
     if eq == "approx":
         return approx_eq
     if callable(eq):
         return eq
     raise ValueError(f"Invalid eq parameter: {eq!r}. Expected None, 'approx', or a callable.")
+
+
+def vectorizable(fn: Callable[..., Any]) -> bool:
+    """Whether every parameter is annotated as a numeric scalar or a numpy array.
+
+    ``@against(vectorized=True)`` only batches such functions; anything else
+    (lists, strings, unannotated parameters) is checked one example at a time.
+    """
+    import inspect
+    from typing import get_type_hints
+
+    try:
+        import numpy as np
+        hints = get_type_hints(fn)
+    except Exception:
+        return False
+    params = inspect.signature(fn).parameters
+    return bool(params) and all(hints.get(name) in (int, float, complex, bool, np.ndarray) for name in params)
+
+
+def stack_kwargs(rows: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Stack each argument across a batch of example kwargs into one numpy array.
+
+    Used by ``@against(vectorized=True)`` to call impl and spec once per batch.
+    Returns None unless every argument is a numeric scalar, or an array of the
+    same shape, in every row; ragged batches are checked row by row instead.
+    """
+    import numbers
+
+    import numpy as np
+
+    stacked: dict[str, Any] = {}
+    for name in rows[0]:
+        values = [row[name] for row in rows]
+        if all(isinstance(v, np.ndarray) for v in values):
+            if any(v.shape != values[0].shape for v in values):
+                return None
+        elif not all(isinstance(v, (numbers.Number, np.generic)) for v in values):
+            return None
+        stacked[name] = np.asarray(values)
+    return stacked
+
+
+def unstack(result: Any, n: int) -> list[Any]:
+    """Split a batched result back into its ``n`` per-row values."""
+    import numpy as np
+    arr = np.asarray(result)
+    if arr.ndim == 0 or len(arr) != n:
+        raise ValueError(f"vectorized result has shape {arr.shape}, expected {n} rows")
+    return list(arr)
+
+
+def batch_equal(a: Any, b: Any) -> bool:
+    """Default eq for vectorized checks: exact, shape-sensitive array equality."""
+    import numpy as np
+    return bool(np.array_equal(a, b))
+
+
+def first_mismatch(a: Any, b: Any) -> tuple[int, Any, Any]:
+    """Locate the first row (along axis 0) where two batched results differ.
+
+    Returns the index and both rows as plain Python values. Falls back to row 0
+    when no element-wise difference can be located, e.g. differing shapes or a
+    batch rejected only by a tolerance-based eq.
+    """
+    import numpy as np
+    a, b = np.asarray(a), np.asarray(b)
+    i = 0
+    try:
+        diff = a != b
+        if diff.ndim > 1:
+            diff = diff.reshape(diff.shape[0], -1).any(axis=1)
+        idx = np.flatnonzero(diff)
+        if idx.size:
+            i = int(idx[0])
+    except Exception:
+        pass
+    return i, _row(a, i), _row(b, i)
+
+
+def _row(arr: Any, i: int) -> Any:
+    return arr[i].tolist() if arr.ndim > 0 and i < len(arr) else arr.tolist()
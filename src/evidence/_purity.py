@@ -15,11 +15,16 @@ from __future__ import annotations
 import ast
 import inspect
 import io
+import operator
 import sys
 import textwrap
+import weakref
 from collections.abc import Callable
+from types import CodeType
 from typing import Any
 
+from evidence._util import _deep_clone, _is_atomic
+
 # Functions / attributes considered impure (static analysis)
 _IO_NAMES: frozenset[str] = frozenset({
     "print", "open", "input",
@@ -47,6 +52,17 @@ _GLOBAL_MUTATION_NAMES: frozenset[str] = frozenset({
     "__import__",
 })
 
+# The exact-name sets above merged into one lookup (they are disjoint)
+_CALL_CATEGORIES: dict[str, str] = {
+    **dict.fromkeys(_IO_NAMES, "io"),
+    **dict.fromkeys(_NONDETERMINISM_NAMES, "nondeterminism"),
+    **dict.fromkeys(_HASH_ADDR_NAMES, "hash_addr"),
+    **dict.fromkeys(_GLOBAL_MUTATION_NAMES, "global_mutation"),
+}
+
+# For str.endswith, which loops over a tuple of suffixes in C
+_IO_ATTR_SUFFIXES: tuple[str, ...] = tuple(_IO_ATTRS)
+
 
 class ImpurityWarning:
     """A single detected impurity in static analysis."""
@@ -64,15 +80,23 @@ class ImpurityWarning:
 
 
 def _get_called_name(node: ast.expr) -> str | None:
-    """Extract a dotted name from a Call node's func attribute."""
+    """Extract a dotted name from a Call node's func attribute.
+
+    An attribute chain on something other than a name, as in ``f().a.b``,
+    yields the attributes alone (``"a.b"``).
+    """
+    parts: list[str] = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
     if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        prefix = _get_called_name(node.value)
-        if prefix is not None:
-            return f"{prefix}.{node.attr}"
-        return node.attr
-    return None
+        parts.append(node.id)
+    return ".".join(reversed(parts)) if parts else None
+
+
+# Warnings by code object, then by seed_deterministic. Weak keys drop an entry with
+# its function, so a reloaded module is analyzed afresh
+_PURITY_CACHE: weakref.WeakKeyDictionary[CodeType, dict[bool, list[ImpurityWarning]]] = weakref.WeakKeyDictionary()
 
 
 def static_purity_check(
@@ -90,8 +114,22 @@ def static_purity_check(
             warnings are still reported.
 
     Returns a list of ImpurityWarning objects. Empty list means no
-    impurities detected (not a guarantee of purity).
+    impurities detected (not a guarantee of purity). Results are cached
+    per code object, so repeated checks of one function parse it once.
     """
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return _static_purity_warnings(fn, seed_deterministic)
+    by_mode = _PURITY_CACHE.get(code)
+    if by_mode is None:
+        by_mode = _PURITY_CACHE[code] = {}
+    warnings = by_mode.get(seed_deterministic)
+    if warnings is None:
+        warnings = by_mode[seed_deterministic] = _static_purity_warnings(fn, seed_deterministic)
+    return list(warnings)
+
+
+def _static_purity_warnings(fn: Callable[..., Any], seed_deterministic: bool) -> list[ImpurityWarning]:
     try:
         source = inspect.getsource(fn)
     except (OSError, TypeError):
@@ -111,36 +149,17 @@ def static_purity_check(
             if name is None:
                 continue
 
-            # Check IO
-            if name in _IO_NAMES:
-                warnings.append(ImpurityWarning("io", f"call to {name}", getattr(node, "lineno", None)))
-            # Check IO attribute access (e.g., sys.stdout.write)
-            for attr in _IO_ATTRS:
-                if name.endswith(attr):
-                    warnings.append(ImpurityWarning("io", f"call to {name}", getattr(node, "lineno", None)))
-                    break
-
-            # Check non-determinism (skip if seed-deterministic mode)
-            if not seed_deterministic:
-                if name in _NONDETERMINISM_NAMES:
-                    warnings.append(
-                        ImpurityWarning("nondeterminism", f"call to {name}", getattr(node, "lineno", None))
-                    )
-                parts = name.split(".")
-                if parts[0] in _NONDETERMINISM_MODULES:
-                    warnings.append(
-                        ImpurityWarning("nondeterminism", f"call to {name}", getattr(node, "lineno", None))
-                    )
-
-            # Check hash/address-dependent
-            if name in _HASH_ADDR_NAMES:
-                warnings.append(ImpurityWarning("hash_addr", f"call to {name}", getattr(node, "lineno", None)))
-
-            # Check global mutation
-            if name in _GLOBAL_MUTATION_NAMES:
-                warnings.append(
-                    ImpurityWarning("global_mutation", f"call to {name}", getattr(node, "lineno", None))
-                )
+            lineno = getattr(node, "lineno", None)
+            # Exact names: IO, non-determinism (skipped if seed-deterministic), hash/address, global mutation
+            category = _CALL_CATEGORIES.get(name)
+            if category is not None and not (seed_deterministic and category == "nondeterminism"):
+                warnings.append(ImpurityWarning(category, f"call to {name}", lineno))
+            # IO attribute access (e.g., sys.stdout.write)
+            if name.endswith(_IO_ATTR_SUFFIXES):
+                warnings.append(ImpurityWarning("io", f"call to {name}", lineno))
+            # Anything from a non-deterministic module (e.g., random.randint)
+            if not seed_deterministic and name.partition(".")[0] in _NONDETERMINISM_MODULES:
+                warnings.append(ImpurityWarning("nondeterminism", f"call to {name}", lineno))
 
         # Also flag global/nonlocal keywords
         elif isinstance(node, ast.Global):
@@ -176,10 +195,8 @@ def dynamic_purity_check(
 
     Returns (is_pure, error_message). error_message is empty if pure.
     """
-    import copy
-
     if eq is None:
-        eq = lambda a, b: a == b  # noqa: E731
+        eq = operator.eq
 
     def _set_seeds(s: int) -> None:
         import random
@@ -195,8 +212,12 @@ def dynamic_purity_check(
         except ImportError:
             pass
 
-    kwargs1 = copy.deepcopy(kwargs)
-    kwargs2 = copy.deepcopy(kwargs)
+    if all(_is_atomic(v) for v in kwargs.values()):
+        # Nothing to mutate; each call unpacks into a fresh dict anyway
+        kwargs1 = kwargs2 = kwargs
+    else:
+        kwargs1 = _deep_clone(kwargs)
+        kwargs2 = _deep_clone(kwargs)
 
     # First call
     if seed is not None:
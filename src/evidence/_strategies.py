@@ -1,27 +1,40 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
+import functools
 import inspect
+import weakref
 from collections.abc import Callable
 from dataclasses import is_dataclass
 from typing import Any, Union, get_args, get_origin, get_type_hints
 
-from hypothesis import find
+from hypothesis import HealthCheck, assume, find, given, settings
 from hypothesis import strategies as st
+from hypothesis.errors import HypothesisException
 
 from evidence._bundle import _check_requires, _root_original
 from evidence._util import StrategyFactory
 
 _STRATEGY_OVERRIDES: dict[Any, st.SearchStrategy[Any]] = {}
 _STRATEGY_FACTORY_OVERRIDES: dict[Any, StrategyFactory] = {}
+# Returned for types with no built-in or registered strategy
+_FALLBACK: st.SearchStrategy[Any] = st.just(None)
+# Signature and resolved type hints per function. Keyed weakly on the function rather than
+# its code object: closures share code but may annotate with different values
+_HINTS_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], tuple[inspect.Signature, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def register_strategy(tp: Any, strat: st.SearchStrategy[Any]) -> None:
     _STRATEGY_OVERRIDES[tp] = strat
+    _cached_type_strategy.cache_clear()
 
 
 def register_strategy_factory(tp: Any, factory: StrategyFactory) -> None:
     _STRATEGY_FACTORY_OVERRIDES[tp] = factory
+    _cached_type_strategy.cache_clear()
 
 
 def _try_override(tp: Any, *, max_list_size: int, depth: int) -> st.SearchStrategy[Any] | None:
@@ -39,7 +52,22 @@ def _try_override(tp: Any, *, max_list_size: int, depth: int) -> st.SearchStrate
     return None
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_type_strategy(tp: Any, max_list_size: int) -> st.SearchStrategy[Any]:
+    return _build_strategy(tp, max_list_size=max_list_size, depth=0)
+
+
 def _strategy_for_type(tp: Any, *, max_list_size: int = 20, depth: int = 0) -> st.SearchStrategy[Any]:
+    # Top-level strategies are reused across functions; registering a strategy clears the cache
+    if depth == 0:
+        try:
+            return _cached_type_strategy(tp, max_list_size)
+        except TypeError:  # unhashable annotation, e.g. Annotated with list metadata
+            pass
+    return _build_strategy(tp, max_list_size=max_list_size, depth=depth)
+
+
+def _build_strategy(tp: Any, *, max_list_size: int, depth: int) -> st.SearchStrategy[Any]:
     if depth > 5:
         return st.none()
 
@@ -101,12 +129,23 @@ def _strategy_for_type(tp: Any, *, max_list_size: int = 20, depth: int = 0) -> s
         }
         return st.builds(tp, **field_strats)
 
-    return st.just(None)
+    return _FALLBACK
+
+
+def _signature_and_hints(fn: Callable[..., Any]) -> tuple[inspect.Signature, dict[str, Any]]:
+    """``inspect.signature(fn)`` and ``get_type_hints(fn)``, resolved once per function."""
+    try:
+        return _HINTS_CACHE[fn]
+    except KeyError:
+        pass
+    except TypeError:  # not weak-referenceable
+        return inspect.signature(fn), get_type_hints(fn)
+    entry = _HINTS_CACHE[fn] = (inspect.signature(fn), get_type_hints(fn))
+    return entry
 
 
 def _strategy_for_function(fn: Callable[..., Any], *, max_list_size: int = 20) -> st.SearchStrategy[dict[str, Any]]:
-    sig = inspect.signature(fn)
-    hints = get_type_hints(fn)
+    sig, hints = _signature_and_hints(fn)
 
     kwargs_strats: dict[str, st.SearchStrategy[Any]] = {}
     for name, param in sig.parameters.items():
@@ -122,6 +161,16 @@ def _strategy_for_function(fn: Callable[..., Any], *, max_list_size: int = 20) -
     return st.fixed_dictionaries(kwargs_strats)
 
 
+def _has_real_inputs(fn: Callable[..., Any], *, max_list_size: int = 20) -> bool:
+    """Whether some parameter of ``fn`` gets a strategy other than the unsupported-type fallback."""
+    sig, hints = _signature_and_hints(fn)
+    return any(
+        _strategy_for_type(hints.get(name, Any), max_list_size=max_list_size) is not _FALLBACK
+        for name, param in sig.parameters.items()
+        if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+    )
+
+
 def _find_satisfying_kwargs(
     fn: Callable[..., Any], strat_kwargs: st.SearchStrategy[dict[str, Any]]
 ) -> dict[str, Any]:
@@ -132,3 +181,36 @@ def _find_satisfying_kwargs(
         return ok_pre
 
     return find(strat_kwargs, ok)
+
+
+def _satisfying_batch(
+    fn: Callable[..., Any], strat_kwargs: st.SearchStrategy[dict[str, Any]], size: int
+) -> list[dict[str, Any]]:
+    """Collect up to ``size`` distinct inputs that satisfy ``fn``'s preconditions.
+
+    The shrunk minimal example from :func:`_find_satisfying_kwargs` comes first;
+    the rest come from a derandomized run, so the batch is the same every time.
+    Raises NoSuchExample if nothing satisfies them.
+    """
+    root = _root_original(fn)
+    batch = [_find_satisfying_kwargs(root, strat_kwargs)]
+    # Compared by repr: == on array arguments is elementwise and has no truth value
+    seen = {repr(batch[0])}
+
+    # Derandomized so the mutation score is reproducible on unchanged code
+    @settings(
+        max_examples=size, database=None, deadline=None, derandomize=True, suppress_health_check=list(HealthCheck)
+    )
+    @given(strat_kwargs)
+    def collect(kwargs: dict[str, Any]) -> None:
+        ok_pre, _ = _check_requires(root, (), kwargs)
+        assume(ok_pre)
+        key = repr(kwargs)
+        if len(batch) < size and key not in seen:
+            seen.add(key)
+            batch.append(kwargs)
+
+    # Failures here (e.g. Unsatisfiable) still leave the minimal example as a usable batch
+    with contextlib.suppress(HypothesisException):
+        collect()
+    return batch
@@ -12,6 +12,7 @@ Requires: pip install evidence[prove]
 
 from __future__ import annotations
 
+import operator
 from collections.abc import Callable
 from typing import Any
 
@@ -58,7 +59,7 @@ def prove_function(
         }
 
     if eq is None:
-        eq = lambda a, b: a == b  # noqa: E731
+        eq = operator.eq
 
     from hypothesis import HealthCheck, assume, given, settings
 
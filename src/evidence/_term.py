@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Callable
 
 _COLOR: bool | None = None
 
@@ -25,30 +26,64 @@ def supports_color() -> bool:
 def force_color(enabled: bool) -> None:
     global _COLOR
     _COLOR = enabled
+    _specialize(enabled)
 
 
-def style(text: str, *codes: int) -> str:
-    if not supports_color() or not codes:
+def _ansi_style(text: str, *codes: int) -> str:
+    if not codes:
         return text
-    seq = ";".join(str(c) for c in codes)
+    seq = ";".join(map(str, codes))
     return f"\033[{seq}m{text}\033[0m"
 
 
-def green(text: str) -> str:
-    return style(text, 32)
+def _plain_style(text: str, *codes: int) -> str:
+    return text
 
 
-def red(text: str) -> str:
-    return style(text, 31)
+def _plain(text: str) -> str:
+    return text
 
 
-def yellow(text: str) -> str:
-    return style(text, 33)
+def _ansi(code: int) -> Callable[[str], str]:
+    prefix = f"\033[{code}m"
 
+    def paint(text: str) -> str:
+        return f"{prefix}{text}\033[0m"
 
-def dim(text: str) -> str:
-    return style(text, 2)
+    return paint
 
 
-def bold(text: str) -> str:
-    return style(text, 1)
+def _auto(code: int) -> Callable[[str], str]:
+    # Until color is decided, detect on first use and swap in the specialized functions
+    def paint(text: str) -> str:
+        enabled = supports_color()
+        _specialize(enabled)
+        return _ansi_style(text, code) if enabled else text
+
+    return paint
+
+
+def _auto_style(text: str, *codes: int) -> str:
+    enabled = supports_color()
+    _specialize(enabled)
+    return _ansi_style(text, *codes) if enabled else text
+
+
+# Rebound by _specialize so no-color runs pay no per-call flag check; use them via the module
+# (``_term.green``) rather than importing the names, or the rebinding is not seen.
+style: Callable[..., str] = _auto_style
+green: Callable[[str], str] = _auto(32)
+red: Callable[[str], str] = _auto(31)
+yellow: Callable[[str], str] = _auto(33)
+dim: Callable[[str], str] = _auto(2)
+bold: Callable[[str], str] = _auto(1)
+
+
+def _specialize(enabled: bool) -> None:
+    global style, green, red, yellow, dim, bold
+    if enabled:
+        style = _ansi_style
+        green, red, yellow, dim, bold = (_ansi(c) for c in (32, 31, 33, 2, 1))
+    else:
+        style = _plain_style
+        green = red = yellow = dim = bold = _plain
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import copy
 import dataclasses
+import json
+import math
 import os
 import time
 from collections.abc import Callable
@@ -8,6 +11,12 @@ from typing import Any
 
 from hypothesis import strategies as st
 
+try:
+    import orjson as _orjson
+    _ORJSON_OPTS = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_SERIALIZE_NUMPY
+except ImportError:  # optional: pip install evidence[json]
+    _orjson = None  # type: ignore[assignment]
+
 EvidencePredicate = Callable[..., bool]
 StrategyFactory = Callable[..., st.SearchStrategy[Any]]
 
@@ -20,19 +29,86 @@ def _now_iso() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
+class _Stopwatch:
+    """Started on construction; ``elapsed`` reads seconds from the integer ns perf counter."""
+
+    __slots__ = ("_t0",)
+
+    def __init__(self) -> None:
+        self._t0 = time.perf_counter_ns()
+
+    @property
+    def elapsed(self) -> float:
+        return (time.perf_counter_ns() - self._t0) / 1e9
+
+
+# Immutable types a deep copy may return as is
+_ATOMIC_TYPES: frozenset[type] = frozenset({int, float, complex, str, bytes, bool, type(None)})
+
+
+def _is_atomic(obj: Any) -> bool:
+    """Whether ``obj`` is an atomic value, or a tuple or frozenset built only from them.
+
+    Exact type checks: subclasses may carry mutable state.
+    """
+    cls = type(obj)
+    if cls in _ATOMIC_TYPES:
+        return True
+    if cls is tuple or cls is frozenset:
+        return all(_is_atomic(x) for x in obj)
+    return False
+
+
+def _deep_clone(obj: Any, memo: dict[int, Any] | None = None) -> Any:
+    """``copy.deepcopy`` with inline fast paths for atomic values and plain lists and dicts.
+
+    Everything else goes to ``copy.deepcopy`` with the same ``memo``, so
+    objects shared between arguments stay shared in the copy.
+    """
+    cls = type(obj)
+    if cls in _ATOMIC_TYPES:
+        return obj
+    if memo is None:
+        memo = {}
+    y = memo.get(id(obj))
+    if y is not None:
+        return y
+    if cls is list:
+        y = memo[id(obj)] = []
+        y.extend([_deep_clone(x, memo) for x in obj])
+    elif cls is dict:
+        y = memo[id(obj)] = {}
+        for k, v in obj.items():
+            y[_deep_clone(k, memo)] = _deep_clone(v, memo)
+    else:
+        y = copy.deepcopy(obj, memo)
+    return y
+
+
 def _qualified_name(fn: Callable[..., Any]) -> str:
     return f"{fn.__module__}.{getattr(fn, '__qualname__', getattr(fn, '__name__', str(fn)))}"
 
 
-def _jsonable(obj: Any) -> Any:
-    if obj is None or isinstance(obj, (bool, int, float, str)):
+# Returned as is by _jsonable; checked by exact type before the isinstance chain
+_JSON_ATOMIC_TYPES: frozenset[type] = frozenset({type(None), bool, int, float, str})
+
+
+def _jsonable(obj: Any, *, tag: bool = True) -> Any:
+    """Convert ``obj`` to JSON-friendly values; anything unrecognized becomes its ``repr``.
+
+    Dataclasses become dicts tagged with ``__dataclass__``. Dataclasses nested
+    inside one are left untagged, as ``dataclasses.asdict`` would produce.
+    """
+    if type(obj) in _JSON_ATOMIC_TYPES or isinstance(obj, (bool, int, float, str)):
         return obj
     if isinstance(obj, (list, tuple)):
-        return [_jsonable(x) for x in obj]
+        return [_jsonable(x, tag=tag) for x in obj]
     if isinstance(obj, dict):
-        return {str(k): _jsonable(v) for k, v in obj.items()}
+        return {str(k): _jsonable(v, tag=tag) for k, v in obj.items()}
     if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
-        return {"__dataclass__": obj.__class__.__name__, **_jsonable(dataclasses.asdict(obj))}
+        # Read fields directly: asdict would deep-copy every value only for it to be converted again
+        fields = {f.name: _jsonable(getattr(obj, f.name), tag=False) for f in dataclasses.fields(obj)}
+        return {"__dataclass__": obj.__class__.__name__, **fields} if tag else fields
     return repr(obj)
 
 
@@ -41,3 +117,36 @@ def _safe_call(pred: EvidencePredicate, *args: Any, **kwargs: Any) -> tuple[bool
         return bool(pred(*args, **kwargs)), None
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether a NaN or infinite float occurs anywhere in ``obj``'s lists, tuples and dicts."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(x) for x in obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    return False
+
+
+def _json_dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to JSON text, using orjson when it is installed.
+
+    Unserializable values fall back to ``str``; ``indent`` matches ``json.dumps(indent=2)``.
+    Both paths write the same compact, UTF-8 layout. orjson writes NaN and infinity as
+    ``null``, so values containing them go through ``json``, which keeps ``NaN``/``Infinity``.
+    """
+    if _orjson is not None:
+        opts = _ORJSON_OPTS | _orjson.OPT_INDENT_2 if indent else _ORJSON_OPTS
+        try:
+            out = _orjson.dumps(obj, default=str, option=opts)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, which orjson rejects without consulting default
+        else:
+            # No null in the output rules out a non-finite float without walking obj
+            if b"null" not in out or not _has_non_finite(obj):
+                return out.decode()
+    if indent:
+        return json.dumps(obj, default=str, indent=2, ensure_ascii=False)
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False)
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import json
+import math
 
 import pytest
 
-from evidence._cli import main
+from evidence import _term
+from evidence._cli import _status_prefix, main
+from evidence._term import force_color
 
 
 # ---------------------------------------------------------------------------
@@ -23,6 +26,20 @@ class TestCLIExitCodes:
         code = main(["nonexistent_module_xyz123", "--no-color"])
         assert code == 1
 
+    def test_cli_import_does_not_load_engine(self):
+        import subprocess
+        import sys
+
+        code = "import sys, evidence._cli; print('evidence._engine' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert out.strip() == "False"
+
+    def test_nothing_decorated_exits_zero(self, tmp_out, capsys, monkeypatch):
+        monkeypatch.setattr("evidence._cli._BUNDLED_MODULES", set())
+        code = main(["example_sort", "--out", tmp_out, "--json", "--no-color"])
+        assert code == 0
+        assert json.loads(capsys.readouterr().out) == []
+
 
 # ---------------------------------------------------------------------------
 # CLI output modes
@@ -41,6 +58,43 @@ class TestCLIOutputModes:
             assert "obligation" in r
             assert "status" in r
 
+    def test_json_mode_streams_one_record_per_line(self, tmp_out, capsys):
+        main(["example_sort", "--out", tmp_out, "--json", "--no-color"])
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "[" and lines[-1] == "]"
+        records = [json.loads(ln.rstrip(",")) for ln in lines[1:-1]]
+        assert all("obligation" in r for r in records)
+
+    def test_json_array_closed_when_checking_raises(self, tmp_out, capsys, monkeypatch):
+        import evidence._engine as engine
+
+        def failing_check_module(module_name, *, on_result, **kwargs):
+            on_result(engine.ObligationResult("m.f", "contracts_smoke", "pass", {}))
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(engine, "check_module", failing_check_module)
+        with pytest.raises(RuntimeError, match="boom"):
+            main(["example_sort", "--out", tmp_out, "--json", "--no-color"])
+        data = json.loads(capsys.readouterr().out)
+        assert [r["obligation"] for r in data] == ["contracts_smoke"]
+
+    def test_json_records_keep_nan_with_orjson(self, tmp_out, capsys, monkeypatch):
+        pytest.importorskip("orjson")
+        import evidence._engine as engine
+
+        def nan_check_module(module_name, *, on_result, **kwargs):
+            details = {"counterexample": {"kwargs": {"x": math.nan}, "impl_result": math.inf}}
+            result = engine.ObligationResult("m.f", "equiv_to_spec", "fail", details)
+            on_result(result)
+            return [result], {}
+
+        monkeypatch.setattr(engine, "check_module", nan_check_module)
+        main(["example_sort", "--out", tmp_out, "--json", "--no-color"])
+        (record,) = json.loads(capsys.readouterr().out)
+        ce = record["details"]["counterexample"]
+        assert math.isnan(ce["kwargs"]["x"])
+        assert ce["impl_result"] == math.inf
+
     def test_quiet_mode(self, tmp_out, capsys):
         main(["example_sort", "--out", tmp_out, "-q", "--no-color"])
         captured = capsys.readouterr()
@@ -75,3 +129,43 @@ class TestCLIFeatureFlags:
     def test_prove_flag(self, tmp_out, capsys):
         code = main(["example_sort", "--out", tmp_out, "--prove", "--no-color"])
         assert code in (0, 1)
+
+
+# ---------------------------------------------------------------------------
+# Result line formatting
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def _restore_color(monkeypatch):
+    # force_color rebinds the _term helpers; let monkeypatch put them back afterwards
+    for name in ("_COLOR", "style", "green", "red", "yellow", "dim", "bold"):
+        monkeypatch.setattr(_term, name, getattr(_term, name))
+
+
+@pytest.mark.usefixtures("_restore_color")
+class TestStatusPrefix:
+    def test_aligned_without_color(self):
+        force_color(False)
+        assert _status_prefix("pass") == "   PASS  "
+        assert _status_prefix("error") == "  ERROR  "
+
+    def test_cached_per_color_mode(self):
+        force_color(False)
+        plain = _status_prefix("fail")
+        force_color(True)
+        colored = _status_prefix("fail")
+        assert plain != colored
+        assert "\033[" in colored
+
+
+@pytest.mark.usefixtures("_restore_color")
+class TestColorSpecialization:
+    def test_no_color_is_identity(self):
+        force_color(False)
+        assert _term.green("x") == "x"
+        assert _term.style("x", 31, 1) == "x"
+
+    def test_color_wraps_ansi(self):
+        force_color(True)
+        assert _term.red("x") == "\033[31mx\033[0m"
+        assert _term.style("x", 31, 1) == "\033[31;1mx\033[0m"
@@ -37,6 +37,18 @@ class TestGetFunctionLines:
             filepath, start, end = result
             assert start > 0
 
+    def test_cached_per_code_object(self, monkeypatch):
+        def f(x: int) -> int:
+            return x
+
+        first = _get_function_lines(f)
+
+        def boom(fn):
+            raise AssertionError("source re-read")
+
+        monkeypatch.setattr("inspect.getsourcelines", boom)
+        assert _get_function_lines(f) == first
+
 
 # ---------------------------------------------------------------------------
 # CoverageCollector
@@ -94,3 +106,123 @@ class TestCoverageCollector:
         collector.stop()
         report = collector.report_for_function(len)
         assert report is None
+
+    @pytest.mark.skipif(
+        not CoverageCollector().available,
+        reason="coverage package not installed",
+    )
+    def test_file_analysis_shared_across_functions(self):
+        def first(x: int) -> int:
+            return x + 1
+
+        def second(x: int) -> int:
+            return x - 1
+
+        collector = CoverageCollector()
+        collector.start()
+        first(1)
+        second(1)
+        collector.stop()
+
+        calls = []
+        analysis2 = collector._cov.analysis2
+        collector._cov.analysis2 = lambda path: calls.append(path) or analysis2(path)
+        assert collector.report_for_function(first) is not None
+        assert collector.report_for_function(second) is not None
+        assert len(calls) == 1
+
+    @pytest.mark.skipif(
+        not CoverageCollector().available,
+        reason="coverage package not installed",
+    )
+    def test_report_all_matches_per_function_reports(self):
+        def covered(x: int) -> int:
+            return x + 1
+
+        def uncovered(x: int) -> int:
+            y = x * 2
+            return y
+
+        collector = CoverageCollector()
+        collector.start()
+        covered(1)
+        collector.stop()
+
+        reports = collector.report_all([covered, uncovered, len])
+        assert set(reports) == {covered, uncovered}
+        for fn, report in reports.items():
+            assert report == collector.report_for_function(fn)
+        # Never called (and defined before start), so every line of it is missing
+        lo, hi = reports[uncovered]["start_line"], reports[uncovered]["end_line"]
+        assert reports[uncovered]["missing_lines"] == list(range(lo, hi + 1))
+
+    @pytest.mark.skipif(
+        not CoverageCollector().available,
+        reason="coverage package not installed",
+    )
+    def test_branch_counts_match_linear_scan(self):
+        def target_fn(x: int) -> int:
+            if x > 0:
+                return x * 2
+            return -x
+
+        collector = CoverageCollector()
+        collector.start()
+        target_fn(5)
+        collector.stop()
+
+        report = collector.report_for_function(target_fn)
+        assert report is not None
+        data = collector._cov._analyze(report["file"])
+        possible, executed = data.arc_possibilities, data.arcs_executed
+        if callable(possible):
+            possible, executed = possible(), executed()
+        lo, hi = report["start_line"], report["end_line"]
+        assert report["branches_total"] == sum(1 for a, _ in possible if lo <= a <= hi)
+        assert report["branches_covered"] == sum(1 for a, _ in executed if lo <= a <= hi)
+        assert 0 < report["branches_covered"] < report["branches_total"]
+
+    @pytest.mark.skipif(
+        not CoverageCollector().available,
+        reason="coverage package not installed",
+    )
+    def test_include_limits_measured_files(self):
+        import json
+
+        def target_fn(x: int) -> int:
+            return x + 1
+
+        collector = CoverageCollector(include=[__file__])
+        collector.start()
+        target_fn(1)
+        json.dumps({"a": 1})
+        collector.stop()
+
+        measured = collector._cov.get_data().measured_files()
+        assert measured
+        assert all(f.endswith("test_coverage.py") for f in measured)
+        assert collector.report_for_function(target_fn) is not None
+
+    @pytest.mark.skipif(
+        not CoverageCollector().available,
+        reason="coverage package not installed",
+    )
+    def test_narrow_keeps_earlier_data(self):
+        def before(x: int) -> int:
+            return x + 1
+
+        def after(x: int) -> int:
+            return x - 1
+
+        collector = CoverageCollector()
+        collector.start()
+        before(1)
+        collector.narrow([__file__])
+        after(1)
+        collector.stop()
+
+        for fn in (before, after):
+            report = collector.report_for_function(fn)
+            assert report is not None
+            # The def lines ran before start(); the bodies ran on either side of narrow()
+            assert report["end_line"] not in report["missing_lines"]
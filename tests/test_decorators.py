@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from evidence._bundle import _get_bundle, _root_original
+from evidence._bundle import _BUNDLED_MODULES, _get_bundle, _root_original
 from evidence._decorators import against, ensures, pure, requires, spec
 
 
@@ -55,6 +55,21 @@ class TestRequires:
         with pytest.raises(AssertionError):
             f(x=200)
 
+    def test_raising_predicate_reported(self):
+        @requires(lambda x: 1 // x > 0)
+        def f(x: int) -> int:
+            return x
+        with pytest.raises(AssertionError, match="ZeroDivisionError"):
+            f(x=0)
+
+    def test_inner_wrapper_sees_outer_predicates(self):
+        def f(x: int) -> int:
+            return x
+        inner = requires(lambda x: x > 0)(f)
+        requires(lambda x: x < 100)(inner)
+        with pytest.raises(AssertionError, match="Precondition failed"):
+            inner(x=200)
+
     def test_bundle_accumulates(self):
         @requires(lambda x: x > 0)
         @requires(lambda x: x < 100)
@@ -89,6 +104,15 @@ class TestEnsures:
             return abs(x) + 1
         assert f(x=-5) == 6
 
+    def test_outer_requires_still_checked(self):
+        @requires(lambda x: x > 0)
+        @ensures(lambda x, result: result > 0)
+        def f(x: int) -> int:
+            return x
+        assert f(x=3) == 3
+        with pytest.raises(AssertionError, match="Precondition failed"):
+            f(x=-1)
+
     def test_also_checks_requires(self):
         @ensures(lambda x, result: result > 0)
         @requires(lambda x: x > 0)
@@ -113,6 +137,7 @@ class TestAgainst:
         b = _get_bundle(f)
         assert b["against"]["spec"] is my_spec
         assert b["against"]["max_examples"] == 200
+        assert b["against"]["vectorized"] is False
 
     def test_custom_max_examples(self):
         def my_spec(x: int) -> int:
@@ -210,6 +235,34 @@ class TestDecoratorChaining:
         assert len(b["ensures"]) == 1
         assert b["against"]["spec"] is ref
 
+    def test_wrappers_cache_root(self):
+        def f(x: int) -> int:
+            return x
+
+        g = requires(lambda x: x >= 0)(f)
+        h = ensures(lambda x, result: result >= 0)(g)
+        assert _root_original(g) is f
+        assert _root_original(h) is f
+        assert h.__evidence_root__ is f
+
+    def test_wrappers_preserve_metadata(self):
+        def f(x: int) -> int:
+            """Doc."""
+            return x
+
+        g = ensures(lambda x, result: True)(requires(lambda x: True)(f))
+        assert g.__name__ == "f"
+        assert g.__doc__ == "Doc."
+        assert g.__annotations__ == f.__annotations__
+        assert g.__wrapped__.__wrapped__ is f
+
+    def test_defining_module_registered(self):
+        def f(x: int) -> int:
+            return x
+
+        ensures(lambda x, result: True)(requires(lambda x: True)(f))
+        assert __name__ in _BUNDLED_MODULES
+
     def test_pure_with_contracts(self):
         @pure
         @ensures(lambda x, result: result >= 0)
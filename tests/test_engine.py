@@ -47,6 +47,18 @@ class TestCollectFunctions:
         fns = _collect_functions(mod)
         assert any(fn is f for fn in fns)
 
+    def test_finds_wrapper_of_later_bundled_root(self):
+        from evidence._bundle import _bundle, _set_original
+        mod = types.ModuleType("dummy_mod")
+        def f(x: int) -> int:
+            return x
+        def wrapper(x: int) -> int:
+            return f(x)
+        _set_original(wrapper, f)
+        _bundle(f)  # bundle attached to the root after wrapping
+        mod.wrapper = wrapper
+        assert _collect_functions(mod) == [wrapper]
+
     def test_ignores_non_callables(self):
         mod = types.ModuleType("dummy_mod")
         mod.x = 42
@@ -90,6 +102,40 @@ class TestCheckModule:
         assert isinstance(data, list)
         assert len(data) == len(results)
 
+    def test_obligations_written_as_results_arrive(self, tmp_out):
+        path = os.path.join(tmp_out, "example_sort.obligations.json")
+        seen = []
+
+        def on_result(r):
+            with open(path) as f:
+                seen.append(f.read().count('"obligation"'))
+
+        results, _ = check_module("example_sort", out_dir=tmp_out, on_result=on_result)
+        assert seen == list(range(1, len(results) + 1))
+        with open(path) as f:
+            text = f.read()
+        assert text.startswith("[\n  {\n")
+        assert json.loads(text) == [r.to_json() for r in results]
+
+    def test_obligations_valid_json_after_failure(self, tmp_out):
+        seen = []
+
+        def on_result(r):
+            seen.append(r)
+            if len(seen) == 2:
+                raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            check_module("example_sort", out_dir=tmp_out, on_result=on_result)
+        with open(os.path.join(tmp_out, "example_sort.obligations.json")) as f:
+            assert json.load(f) == [r.to_json() for r in seen]
+
+    def test_counterexamples_persist_in_out_dir(self, tmp_out):
+        check_module("example_sort", out_dir=tmp_out)
+        db_dir = os.path.join(tmp_out, ".hyp_db")
+        assert os.path.isdir(db_dir)
+        assert any(files for _, _, files in os.walk(db_dir))
+
     def test_on_result_callback(self, tmp_out):
         collected = []
         results, _ = check_module("example_sort", out_dir=tmp_out, on_result=collected.append)
@@ -106,6 +152,14 @@ class TestCheckModule:
                 # Shrunk CE should have small-ish input
                 assert isinstance(ce["kwargs"], dict)
 
+    def test_parallel_jobs_match_sequential(self, tmp_out):
+        seq, _ = check_module("example_sort", out_dir=tmp_out)
+        par, trust = check_module("example_sort", out_dir=tmp_out, jobs=2)
+        assert [(r.function, r.obligation, r.status) for r in par] == [
+            (r.function, r.obligation, r.status) for r in seq
+        ]
+        assert len(trust["functions"]) == 2
+
     def test_smoke_test_pass(self, tmp_out):
         results, _ = check_module("example_sort", out_dir=tmp_out)
         smoke_results = [r for r in results if r.obligation == "contracts_smoke"]
@@ -127,6 +181,26 @@ class TestCheckModuleFeatures:
                 assert "lines_total" in cr.details
                 assert "line_coverage_pct" in cr.details
 
+    def test_coverage_of_reexported_function(self, tmp_out, tmp_path, monkeypatch):
+        pytest.importorskip("coverage")
+        (tmp_path / "cov_lib.py").write_text(
+            "from evidence import ensures\n"
+            "\n"
+            "\n"
+            "@ensures(lambda x, result: result >= 0)\n"
+            "def absval(x: int) -> int:\n"
+            "    if x < 0:\n"
+            "        return -x\n"
+            "    return x\n"
+        )
+        (tmp_path / "cov_main.py").write_text("from cov_lib import absval  # noqa: F401\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        results, _ = check_module("cov_main", out_dir=tmp_out, coverage=True)
+        (cov,) = [r for r in results if r.obligation == "coverage"]
+        assert cov.details["file"].endswith("cov_lib.py")
+        assert cov.details["lines_covered"] >= cov.details["lines_total"] - 1 > 0
+
     def test_mutate_flag(self, tmp_out):
         """Feature 4: Mutation testing."""
         results, _ = check_module("example_sort", out_dir=tmp_out, mutate=True)
@@ -137,6 +211,50 @@ class TestCheckModuleFeatures:
             assert "killed" in mr.details
             assert "mutation_score" in mr.details
 
+    def test_mutate_parallel_matches_in_process(self):
+        import importlib
+
+        from evidence._bundle import _get_bundle, _root_original
+        from evidence._engine import _eval_mutant, _eval_mutant_at, _mutation_oracle
+        from evidence._mutate import generate_mutants
+
+        funcs = _collect_functions(importlib.import_module("example_sort"))
+        index = next(i for i, f in enumerate(funcs) if not _get_bundle(f)["is_spec"])
+        root = _root_original(funcs[index])
+        spec_fn, eq_fn = _mutation_oracle(_get_bundle(root))
+        batch = [{"xs": []}, {"xs": [3, 1, 2]}, {"xs": [2, 2, 1, 0]}]
+        for m in generate_mutants(root, max_mutants=10):
+            assert _eval_mutant_at("example_sort", index, m, batch) == _eval_mutant(m, root, spec_fn, eq_fn, batch)
+
+    def test_mutate_with_jobs(self, tmp_out):
+        results, _ = check_module("example_sort", out_dir=tmp_out, mutate=True, jobs=2)
+        mut_results = [r for r in results if r.obligation == "mutation_score"]
+        assert mut_results
+        for mr in mut_results:
+            d = mr.details
+            assert d["killed"] + d["survived"] + d["errors"] == d["total_mutants"]
+
+    def test_strategies_built_once_per_size(self, tmp_out, monkeypatch):
+        import evidence._engine as engine
+
+        built = []
+        original = engine._strategy_for_function
+
+        def counting(fn, *, max_list_size=20):
+            built.append((fn, max_list_size))
+            return original(fn, max_list_size=max_list_size)
+
+        monkeypatch.setattr(engine, "_strategy_for_function", counting)
+        check_module("example_sort", out_dir=tmp_out, mutate=True)
+        assert built
+        assert len(built) == len(set(built))
+
+    def test_caches_released_after_run(self, tmp_out):
+        import evidence._engine as engine
+
+        check_module("example_sort", out_dir=tmp_out)
+        assert engine._STRATEGY_CACHE == {}
+
     def test_infer_flag(self, tmp_out):
         """Feature 7: Spec inference."""
         results, _ = check_module("example_sort", out_dir=tmp_out, infer=True)
@@ -146,9 +264,257 @@ class TestCheckModuleFeatures:
             assert "properties_found" in ir.details
             assert "holding" in ir.details
 
+    def test_infer_structural_at_matches_in_process(self):
+        import example_sort
+
+        from evidence._engine import _infer_structural_at
+        from evidence._infer import infer_structural
+
+        index = _collect_functions(example_sort).index(example_sort.sort)
+        in_worker = _infer_structural_at("example_sort", index)
+        assert [p.name for p in in_worker] == [p.name for p in infer_structural(example_sort.sort)]
+
+    def test_infer_with_jobs(self, tmp_out):
+        results, _ = check_module("example_sort", out_dir=tmp_out, infer=True, jobs=2)
+        infer_results = [r for r in results if r.obligation == "inferred_properties"]
+        assert infer_results
+        for ir in infer_results:
+            names = {p["name"] for p in ir.details["holding"] + ir.details["not_holding"]}
+            assert {"shape_preservation", "sortedness"} <= names
+
     def test_prove_flag_graceful(self, tmp_out):
         """Feature 5: Symbolic verification (may be unavailable)."""
         results, _ = check_module("example_sort", out_dir=tmp_out, prove=True)
         proof_results = [r for r in results if r.obligation == "symbolic_proof"]
         # Should produce results even if crosshair not installed
         assert len(proof_results) > 0
+
+
+# ---------------------------------------------------------------------------
+# Spec equivalence
+# ---------------------------------------------------------------------------
+
+class TestEquivalence:
+    def test_raising_impl_is_a_failure_with_counterexample(self):
+        from evidence._decorators import against
+        from evidence._engine import _check_function
+
+        def head_spec(xs: list[int]) -> int:
+            return xs[0] if xs else 0
+
+        @against(head_spec)
+        def head(xs: list[int]) -> int:
+            return xs[0]
+
+        results = _check_function(head, max_list_size=5, smoke_max_list_size=5)
+        equiv = [r for r in results if r.obligation == "equiv_to_spec"]
+        assert [r.status for r in equiv] == ["fail"]
+        ce = equiv[0].details["counterexample"]
+        assert ce["kwargs"] == {"xs": []}
+        assert ce["error"].startswith("IndexError")
+
+    def test_vectorized_batches_report_mismatching_row(self):
+        pytest.importorskip("numpy")
+        from evidence._decorators import against
+        from evidence._engine import _check_function
+
+        calls = []
+
+        def square_spec(x: int) -> int:
+            return x * x
+
+        @against(square_spec, vectorized=True, max_examples=1000)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x + (x > 100)
+
+        results = _check_function(square, max_list_size=5, smoke_max_list_size=5)
+        equiv = [r for r in results if r.obligation == "equiv_to_spec"]
+        assert [r.status for r in equiv] == ["fail"]
+        ce = equiv[0].details["counterexample"]
+        assert ce["kwargs"]["x"] > 100
+        assert ce["impl_result"] == ce["spec_result"] + 1
+        assert ce["batch_size"] == 128
+        # Called with whole batches, not one example at a time
+        assert all(getattr(x, "shape", None) == (128,) for x in calls[1:])
+
+    def test_vectorized_checks_ensures_per_row(self):
+        pytest.importorskip("numpy")
+        from evidence._decorators import against, ensures
+        from evidence._engine import _check_function
+
+        def double_spec(x: int) -> int:
+            return 2 * x
+
+        @against(double_spec, vectorized=True, max_examples=10)
+        @ensures(lambda x, result: result != 0)
+        def double(x: int) -> int:
+            return 2 * x
+
+        results = _check_function(double, max_list_size=5, smoke_max_list_size=5)
+        equiv = [r for r in results if r.obligation == "equiv_to_spec"]
+        assert [r.status for r in equiv] == ["fail"]
+        ce = equiv[0].details["counterexample"]
+        assert ce["kwargs"] == {"x": 0}
+        assert ce["note"].startswith("ensures failed")
+
+    def test_vectorized_list_arguments_checked_per_example(self):
+        pytest.importorskip("numpy")
+        from evidence._decorators import against
+        from evidence._engine import _check_function
+
+        calls = []
+
+        def total_spec(xs: list[int]) -> int:
+            return sum(xs)
+
+        @against(total_spec, vectorized=True, max_examples=20)
+        def total(xs: list[int]) -> int:
+            calls.append(xs)
+            return sum(xs) + (len(xs) > 2)
+
+        results = _check_function(total, max_list_size=5, smoke_max_list_size=5)
+        equiv = [r for r in results if r.obligation == "equiv_to_spec"]
+        assert [r.status for r in equiv] == ["fail"]
+        assert len(equiv[0].details["counterexample"]["kwargs"]["xs"]) == 3
+        assert all(isinstance(xs, list) for xs in calls)
+
+    def test_vectorized_many_float_parameters_pass(self):
+        pytest.importorskip("numpy")
+        from evidence._decorators import against
+        from evidence._engine import _check_function
+
+        calls = []
+
+        # Weights sum below 1, so no intermediate overflows to inf
+        def blend_spec(a: float, b: float, c: float, d: float, e: float, f: float) -> float:
+            return a / 2 + b / 4 + c / 8 + d / 16 + e / 32 + f / 64
+
+        @against(blend_spec, vectorized=True, max_examples=200)
+        def blend(a: float, b: float, c: float, d: float, e: float, f: float) -> float:
+            calls.append(a)
+            return a / 2 + b / 4 + c / 8 + d / 16 + e / 32 + f / 64
+
+        results = _check_function(blend, max_list_size=5, smoke_max_list_size=5)
+        equiv = [r for r in results if r.obligation == "equiv_to_spec"]
+        assert [r.status for r in equiv] == ["pass"]
+        # max_examples counts inputs: 200 of them fit in two batches of 128
+        assert len([x for x in calls if getattr(x, "shape", None) == (128,)]) <= 2
+
+
+# ---------------------------------------------------------------------------
+# Purity
+# ---------------------------------------------------------------------------
+
+class TestPurity:
+    def test_dynamic_check_reuses_smoke_input(self, monkeypatch):
+        from evidence import _engine
+        from evidence._decorators import pure, requires
+
+        calls = []
+        real_find = _engine._find_satisfying_kwargs
+
+        def counting_find(fn, strat):
+            calls.append(fn)
+            return real_find(fn, strat)
+
+        monkeypatch.setattr(_engine, "_find_satisfying_kwargs", counting_find)
+
+        @pure
+        @requires(lambda xs: len(xs) >= 2)
+        def drain(xs: list[int]) -> int:
+            n = len(xs)
+            xs.clear()
+            return n
+
+        results = _engine._check_function(drain, max_list_size=5, smoke_max_list_size=5)
+        dyn = [r for r in results if r.obligation == "pure_dynamic"]
+        assert len(calls) == 1
+        assert [r.status for r in dyn] == ["pass"]
+        # The smoke call drained its input; purity still sees the original
+        assert len(dyn[0].details["example"]["xs"]) >= 2
+
+
+# ---------------------------------------------------------------------------
+# Mutation input batches
+# ---------------------------------------------------------------------------
+
+class TestSatisfyingBatch:
+    def test_batch_is_distinct_and_satisfies_requires(self):
+        from evidence._decorators import requires
+        from evidence._strategies import _satisfying_batch, _strategy_for_function
+
+        @requires(lambda x: x > 3)
+        def f(x: int) -> int:
+            return x
+
+        batch = _satisfying_batch(f, _strategy_for_function(f), 10)
+        assert 1 < len(batch) <= 10
+        assert batch[0] == {"x": 4}
+        assert all(kw["x"] > 3 for kw in batch)
+        assert len({kw["x"] for kw in batch}) == len(batch)
+
+    def test_batch_is_reproducible(self):
+        from evidence._strategies import _satisfying_batch, _strategy_for_function
+
+        def f(xs: list[int], y: int) -> int:
+            return y
+
+        strat = _strategy_for_function(f)
+        assert _satisfying_batch(f, strat, 15) == _satisfying_batch(f, strat, 15)
+
+    def test_batch_of_array_arguments(self):
+        np = pytest.importorskip("numpy")
+        from hypothesis import strategies as st
+
+        from evidence._strategies import _satisfying_batch
+
+        def f(a: np.ndarray) -> float:
+            return float(a.sum())
+
+        strat = st.fixed_dictionaries({"a": st.lists(st.integers(0, 9), min_size=2, max_size=5).map(np.array)})
+        assert len(_satisfying_batch(f, strat, 10)) > 1
+
+
+# ---------------------------------------------------------------------------
+# Type strategies
+# ---------------------------------------------------------------------------
+
+class TestStrategyForType:
+    def test_top_level_strategies_are_reused(self):
+        from evidence._strategies import _strategy_for_type
+
+        assert _strategy_for_type(list[int]) is _strategy_for_type(list[int])
+        assert _strategy_for_type(list[int]) is not _strategy_for_type(list[int], max_list_size=5)
+
+    def test_registering_invalidates_cache(self):
+        from hypothesis import strategies as st
+
+        from evidence._strategies import _STRATEGY_OVERRIDES, _strategy_for_type, register_strategy
+
+        class Token(str):
+            pass
+
+        before = _strategy_for_type(Token)
+        custom = st.just(Token("t"))
+        register_strategy(Token, custom)
+        try:
+            assert before is not custom
+            assert _strategy_for_type(Token) is custom
+        finally:
+            _STRATEGY_OVERRIDES.pop(Token)
+
+    def test_hints_resolved_once_per_function(self, monkeypatch):
+        from evidence import _strategies
+
+        calls = []
+        real = _strategies.get_type_hints
+        monkeypatch.setattr(_strategies, "get_type_hints", lambda fn: calls.append(fn) or real(fn))
+
+        def f(x: int, ys: list[int]) -> int:
+            return x
+
+        _strategies._strategy_for_function(f)
+        _strategies._strategy_for_function(f, max_list_size=5)
+        assert _strategies._has_real_inputs(f)
+        assert calls == [f]
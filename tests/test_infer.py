@@ -5,12 +5,21 @@ from __future__ import annotations
 from evidence._infer import (
     InferredProperty,
     _quick_check,
+    _quick_check_all,
     infer_all,
     infer_from_docstring,
     infer_structural,
 )
 
 
+class Opaque:
+    """A parameter type with no strategy."""
+
+
+class Meters(float):
+    """A parameter type given a strategy by register_strategy."""
+
+
 # ---------------------------------------------------------------------------
 # InferredProperty
 # ---------------------------------------------------------------------------
@@ -43,6 +52,16 @@ class TestQuickCheck:
         result = _quick_check(f, lambda kw, r: r < 0)  # not always true
         assert result is False
 
+    def test_shared_run_reports_each_predicate(self):
+        def f(x: int) -> int:
+            return x * 2
+
+        def raises(kw, r):
+            raise ValueError
+
+        results = _quick_check_all(f, [lambda kw, r: r % 2 == 0, lambda kw, r: r < 0, raises])
+        assert results == [True, False, False]
+
 
 # ---------------------------------------------------------------------------
 # infer_structural
@@ -69,6 +88,14 @@ class TestInferStructural:
         sort_prop = next(p for p in props if p.name == "sortedness")
         assert sort_prop.holds is True
 
+    def test_list_to_list_not_sorted(self):
+        def rev_fn(xs: list[int]) -> list[int]:
+            return sorted(xs, reverse=True)
+
+        props = infer_structural(rev_fn)
+        sort_prop = next(p for p in props if p.name == "sortedness")
+        assert sort_prop.holds is False
+
     def test_idempotence(self):
         def f(x: int) -> int:
             return abs(x)
@@ -89,6 +116,46 @@ class TestInferStructural:
         inv = next(p for p in props if p.name == "involution")
         assert inv.holds is True
 
+    def test_unsupported_parameter_types_skipped(self):
+        def f(x: Opaque) -> Opaque:
+            return x
+
+        assert infer_structural(f) == []
+
+    def test_registered_strategy_is_used(self):
+        from hypothesis import strategies as st
+
+        from evidence._strategies import _STRATEGY_OVERRIDES, _cached_type_strategy, register_strategy
+
+        register_strategy(Meters, st.floats(-10, 10).map(Meters))
+        try:
+            def f(x: Meters) -> Meters:
+                return Meters(abs(x))
+
+            props = {p.name: p.holds for p in infer_structural(f)}
+            assert props == {"idempotence": True, "involution": False}
+        finally:
+            _STRATEGY_OVERRIDES.pop(Meters)
+            _cached_type_strategy.cache_clear()
+
+    def test_idempotence_and_involution_share_second_call(self):
+        from evidence._infer import _RAISED, _reapply
+
+        calls = []
+
+        def f(x: int) -> int:
+            calls.append(x)
+            if x == 0:
+                raise ZeroDivisionError
+            return -x
+
+        twice = _reapply(f, "x")
+        kw = {"x": 3}
+        assert twice(kw, -3) == 3
+        assert twice(kw, -3) == 3
+        assert calls == [-3]
+        assert twice({"x": 0}, 0) is _RAISED
+
     def test_non_idempotent(self):
         def f(x: int) -> int:
             return x + 1
@@ -129,6 +196,16 @@ class TestInferFromDocstring:
         props = infer_from_docstring(f)
         assert props == []
 
+    def test_multiple_patterns_case_insensitive(self):
+        def f(xs: list[int]) -> list[int]:
+            """RETURNS THE SORTED LIST; ALL ELEMENTS ARE UNIQUE."""
+            return sorted(set(xs))
+
+        props = infer_from_docstring(f)
+        names = [p.name for p in props]
+        assert "sortedness" in names
+        assert "uniqueness" in names
+
     def test_idempotent_docstring(self):
         def f(x: int) -> int:
             """This function is idempotent."""
@@ -163,6 +240,16 @@ class TestInferAll:
         assert "structural" in sources
         assert "docstring" in sources
 
+    def test_precomputed_structural(self):
+        def sort_fn(xs: list[int]) -> list[int]:
+            """Returns a sorted list."""
+            return sorted(xs)
+
+        given = [InferredProperty("sortedness", "output is sorted", True)]
+        props = infer_all(sort_fn, structural=given)
+        assert props[0] is given[0]
+        assert [p.source for p in props[1:]] == ["docstring"]
+
     def test_without_llm(self):
         def f(x: int) -> int:
             return x * 2
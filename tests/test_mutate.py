@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+from functools import lru_cache
 
 from evidence._mutate import (
     Mutant,
@@ -115,6 +116,18 @@ class TestGenerateMutants:
         ret_mutants = [m for m in mutants if m.operator == "remove_return"]
         assert len(ret_mutants) > 0
 
+    def test_no_mutant_identical_to_original(self):
+        def f(x: int) -> int | None:
+            if x > 0:
+                return None
+            pass
+            return x
+
+        mutants = generate_mutants(f)
+        original = ast.dump(mutants[0].tree)
+        assert all(ast.dump(m.materialize()) != original for m in mutants)
+        assert [m.lineno for m in mutants if m.operator == "remove_return"] == [5]
+
     def test_max_mutants_limit(self):
         def f(x: int) -> int:
             if x > 0:
@@ -162,6 +175,72 @@ class TestCompileMutant:
             # x + 1 should become x - 1
             assert compiled(5) != f(5)
 
+    def test_compiles_cached_function(self):
+        @lru_cache(maxsize=8)
+        def f(x: int) -> int:
+            return x + 1
+
+        mutants = generate_mutants(f)
+        assert len(mutants) > 0
+        assert all(compile_mutant(m, f) is not None for m in mutants)
+
+    def test_unpatched_mutant_without_locations(self):
+        def f(x: int) -> int:
+            return x + 1
+
+        tree = ast.parse("def f(x):\n    return x + 1\n")
+        tree.body[0].body[0] = ast.Return(value=ast.BinOp(ast.Name("x", ast.Load()), ast.Sub(), ast.Constant(1)))
+        compiled = compile_mutant(Mutant("swap_arithmetic", "Add -> Sub", None, tree), f)
+        assert compiled is not None
+        assert compiled(5) == 4
+
+    def test_mutants_share_one_unmodified_tree(self):
+        def f(x: int) -> int:
+            if x > 0:
+                return x + 1
+            return -x
+
+        mutants = generate_mutants(f)
+        assert len({id(m.tree) for m in mutants}) == 1
+        before = ast.dump(mutants[0].tree)
+        for m in mutants:
+            compile_mutant(m, f)
+        assert ast.dump(mutants[0].tree) == before
+        assert all(ast.dump(m.materialize()) != before for m in mutants)
+
+    def test_compiled_code_reused_for_identical_mutants(self, monkeypatch):
+        import builtins
+
+        from evidence import _mutate
+
+        def f(x: int) -> int:
+            return x + 1
+
+        monkeypatch.setattr(_mutate, "_COMPILE_CACHE", {})
+        calls = []
+
+        def counting_compile(*args, **kwargs):
+            calls.append(args[1])
+            return builtins.compile(*args, **kwargs)
+
+        monkeypatch.setattr(_mutate, "compile", counting_compile, raising=False)
+        first = generate_mutants(f)
+        second = generate_mutants(f)
+        for m in first + second:
+            assert compile_mutant(m, f) is not None
+        assert len(calls) == len(first)
+
+    def test_pickled_mutant_compiles(self):
+        import pickle
+
+        def f(x: int) -> int:
+            return x + 1
+
+        (arith,) = [m for m in generate_mutants(f) if m.operator == "swap_arithmetic"]
+        compiled = compile_mutant(pickle.loads(pickle.dumps(arith)), f)
+        assert compiled is not None
+        assert compiled(5) == 4
+
 
 # ---------------------------------------------------------------------------
 # Mutant repr
@@ -76,6 +76,30 @@ class TestApproxEqNumpy:
         b = np.array([1.0, 5.0, 3.0])
         assert approx_eq(a, b) is False
 
+    def test_long_float_lists(self):
+        a = [float(i) for i in range(500)]
+        assert approx_eq(a, [x + 1e-9 for x in a]) is True
+        assert approx_eq(a, [*a[:-1], 1e9]) is False
+        assert approx_eq([*a, math.inf], [*a, math.inf]) is True
+        assert approx_eq([*a, math.nan], [*a, math.nan]) is False
+
+    def test_long_mixed_lists_compare_ints_exactly(self):
+        a = [float(i) for i in range(499)]
+        assert approx_eq([*a, 10**6], [*a, 10**6 + 1]) is False
+
+    def test_numpy_array_on_right(self):
+        import numpy as np
+        assert approx_eq([1.0, 2.0], np.array([1.0, 2.0 + 1e-9])) is True
+
+    def test_numpy_subclass(self):
+        import numpy as np
+
+        class Tagged(np.ndarray):
+            pass
+
+        a = np.array([1.0, 2.0]).view(Tagged)
+        assert approx_eq(a, np.array([1.0, 2.0 + 1e-9])) is True
+
 
 # ---------------------------------------------------------------------------
 # resolve_eq
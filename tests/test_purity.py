@@ -92,6 +92,42 @@ class TestStaticPurityCheck:
         assert len(warnings) > 0
         assert all(w.lineno is not None for w in warnings)
 
+    def test_called_names(self):
+        import ast
+
+        from evidence._purity import _get_called_name
+
+        def called(src: str) -> str | None:
+            return _get_called_name(ast.parse(src).body[0].value.func)
+
+        assert called("f()") == "f"
+        assert called("sys.stdout.write()") == "sys.stdout.write"
+        assert called("f().a.b()") == "a.b"
+        assert called("(lambda: 1)()") is None
+
+    def test_call_name_sets_are_disjoint(self):
+        from evidence import _purity
+
+        sets = [_purity._IO_NAMES, _purity._NONDETERMINISM_NAMES, _purity._HASH_ADDR_NAMES,
+                _purity._GLOBAL_MUTATION_NAMES]
+        assert len(_purity._CALL_CATEGORIES) == sum(len(s) for s in sets)
+
+    def test_repeated_checks_parse_once(self, monkeypatch):
+        import inspect
+
+        def f(x: int) -> int:
+            return x + random.randint(0, 10)
+
+        calls = []
+        getsource = inspect.getsource
+        monkeypatch.setattr(inspect, "getsource", lambda obj: calls.append(obj) or getsource(obj))
+        first = static_purity_check(f)
+        first.clear()
+        assert [w.category for w in static_purity_check(f)] == ["nondeterminism"]
+        assert static_purity_check(f, seed_deterministic=True) == []
+        static_purity_check(f, seed_deterministic=True)
+        assert len(calls) == 2
+
 
 # ---------------------------------------------------------------------------
 # Dynamic purity analysis
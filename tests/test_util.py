@@ -0,0 +1,99 @@
+"""Tests for the shared helpers in evidence._util."""
+
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from evidence._util import _json_dumps, _jsonable
+
+
+# ---------------------------------------------------------------------------
+# JSON output
+# ---------------------------------------------------------------------------
+
+class TestJsonDumps:
+    def test_round_trips_awkward_values(self):
+        record = {"kwargs": {"n": 2**80, "m": {1: "a"}}, "when": object}
+        data = json.loads(_json_dumps(record))
+        assert data["kwargs"]["n"] == 2**80
+        assert data["when"] == str(object)
+
+    def test_int_keys_stringified(self):
+        assert json.loads(_json_dumps({1: [1, 2]})) == {"1": [1, 2]}
+
+    @pytest.mark.parametrize("record", [
+        {"kwargs": {"x": math.nan, "ys": [math.inf, -math.inf]}, "error": None},
+        {"kwargs": {"n": 2**80, "s": "caf\u00e9"}, "result": [0.5, None]},
+        {"kwargs": {1: "a"}, "nested": [{"b": {}}, []]},
+    ])
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_same_text_with_and_without_orjson(self, monkeypatch, record, indent):
+        from evidence import _util
+
+        if _util._orjson is None:
+            pytest.skip("orjson not installed")
+        with_orjson = _json_dumps(record, indent=indent)
+        monkeypatch.setattr(_util, "_orjson", None)
+        assert _json_dumps(record, indent=indent) == with_orjson
+
+    def test_non_finite_floats_kept(self):
+        text = _json_dumps({"x": math.nan, "y": math.inf, "z": None})
+        assert text == '{"x":NaN,"y":Infinity,"z":null}'
+
+
+class TestJsonable:
+    def test_nested_dataclasses_untagged(self):
+        import threading
+        from dataclasses import dataclass
+
+        @dataclass
+        class Inner:
+            xs: tuple[int, ...]
+
+        @dataclass
+        class Outer:
+            inner: Inner
+            lock: object
+
+        lock = threading.Lock()  # deepcopy, and so dataclasses.asdict, would reject this
+        out = _jsonable({1: [Outer(Inner((1, 2)), lock)]})
+        assert out == {"1": [{"__dataclass__": "Outer", "inner": {"xs": [1, 2]}, "lock": repr(lock)}]}
+
+
+# ---------------------------------------------------------------------------
+# Cloning
+# ---------------------------------------------------------------------------
+
+class TestDeepClone:
+    def test_copies_containers_and_keeps_sharing(self):
+        from dataclasses import dataclass
+
+        from evidence._util import _deep_clone
+
+        @dataclass
+        class Box:
+            items: list[int]
+
+        shared = [1, 2]
+        box = Box(shared)
+        kwargs = {"a": shared, "b": shared, "box": box, "t": (shared, "s")}
+        clone = _deep_clone(kwargs)
+        assert clone == kwargs
+        assert clone["a"] is not shared
+        assert clone["a"] is clone["b"] is clone["box"].items is clone["t"][0]
+        assert clone["box"] is not box
+
+    def test_is_atomic(self):
+        from evidence._util import _is_atomic
+
+        assert _is_atomic((1, "a", (None, 2.0), frozenset({b"x"})))
+        assert not _is_atomic((1, [2]))
+        assert not _is_atomic([1])
+
+        class Tagged(int):
+            pass
+
+        assert not _is_atomic(Tagged(1))